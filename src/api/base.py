@@ -1,9 +1,14 @@
 """Base client for GoHighLevel API v2 with shared functionality"""
 
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 import httpx
+import orjson
 
 from ..services.oauth import OAuthService
+from ..utils.cache import STALE_TTL, TTLCache
 from ..utils.exceptions import handle_api_error
 
 
@@ -12,15 +17,87 @@ class BaseGoHighLevelClient:
 
     API_BASE_URL = "https://services.leadconnectorhq.com"
 
-    def __init__(self, oauth_service: OAuthService):
+    # Headers sent with every request; only Authorization varies per token
+    BASE_HEADERS = MappingProxyType(
+        {
+            "Version": "2021-07-28",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            # JSON list pages compress well; brotli comes from the httpx extra
+            "Accept-Encoding": "br, gzip",
+        }
+    )
+
+    # In custom mode OAuthService refreshes tokens 5 minutes before they
+    # expire, so headers cached for less than that never outlive their token.
+    # StandardAuthService hands tokens out right up to expiry, so there a
+    # cached header can carry an expired token for up to this long; the 401
+    # it gets back drops the header, and the next request fetches a new one.
+    HEADER_CACHE_TTL = 240.0
+
+    # Upper bound on in-flight requests, so large fan-outs queue here instead
+    # of exhausting the connection pool or tripping the API rate limiter
+    MAX_CONCURRENT_REQUESTS = 32
+
+    # Keep a pooled connection for every request the semaphore lets through,
+    # so HTTP/1.1 fallback does not churn connections under fan-out
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+        keepalive_expiry=60.0,
+    )
+
+    # GET responses kept for revalidation with If-None-Match
+    ETAG_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        oauth_service: OAuthService,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
         self.oauth_service = oauth_service
-        self.client = httpx.AsyncClient(base_url=self.API_BASE_URL)
+        # Only close the HTTP client on exit if this instance created it
+        self._owns_client = client is None
+        self.client = client if client is not None else self.create_http_client()
+        # Clients sharing an HTTP client should share the semaphore too
+        self._semaphore = semaphore or asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Request headers per location_id (None for the agency token)
+        self._header_cache: Dict[Optional[str], Tuple[float, Dict[str, str]]] = {}
+        self._header_locks: Dict[Optional[str], asyncio.Lock] = {}
+        # GET (location_id, endpoint, params) -> (ETag, content type, body)
+        self._etag_cache = TTLCache(self.ETAG_CACHE_SIZE)
+
+    @classmethod
+    def create_http_client(
+        cls, limits: Optional[httpx.Limits] = None
+    ) -> httpx.AsyncClient:
+        """Create an HTTP client for the GoHighLevel API
+
+        Args:
+            limits: Connection pool limits (default: HTTP_LIMITS)
+        """
+        # HTTP/2 lets concurrent calls multiplex over a single connection
+        return httpx.AsyncClient(
+            base_url=cls.API_BASE_URL,
+            http2=True,
+            limits=limits or cls.HTTP_LIMITS,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
+
+    def _cached_headers(self, location_id: Optional[str]) -> Optional[Dict[str, str]]:
+        """Return unexpired cached headers for location_id, if any"""
+        cached = self._header_cache.get(location_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
 
     async def _get_headers(self, location_id: Optional[str] = None) -> Dict[str, str]:
         """Get request headers with valid token
@@ -28,19 +105,30 @@ class BaseGoHighLevelClient:
         Args:
             location_id: If provided, will get location-specific token
         """
-        if location_id:
-            # Get location-specific token for contact operations
-            token = await self.oauth_service.get_location_token(location_id)
-        else:
-            # Use agency token for general operations
-            token = await self.oauth_service.get_valid_token()
-
-        return {
-            "Authorization": f"Bearer {token}",
-            "Version": "2021-07-28",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        headers = self._cached_headers(location_id)
+        if headers is not None:
+            return headers
+
+        # Serialize token lookups per key so concurrent misses fetch only once
+        lock = self._header_locks.setdefault(location_id, asyncio.Lock())
+        async with lock:
+            headers = self._cached_headers(location_id)
+            if headers is not None:
+                return headers
+
+            if location_id:
+                # Get location-specific token for contact operations
+                token = await self.oauth_service.get_location_token(location_id)
+            else:
+                # Use agency token for general operations
+                token = await self.oauth_service.get_valid_token()
+
+            headers = {"Authorization": f"Bearer {token}", **self.BASE_HEADERS}
+            self._header_cache[location_id] = (
+                time.monotonic() + self.HEADER_CACHE_TTL,
+                headers,
+            )
+            return headers
 
     async def _request(
         self,
@@ -52,18 +140,69 @@ class BaseGoHighLevelClient:
         **kwargs,
     ) -> httpx.Response:
         """Make an authenticated request to the API"""
-        headers = await self._get_headers(location_id)
-
-        response = await self.client.request(
-            method=method,
-            url=endpoint,
-            headers=headers,
-            params=params,
-            json=json,
-            **kwargs,
+        # Skip creating a coroutine when the headers are already cached
+        headers = self._cached_headers(location_id) or await self._get_headers(
+            location_id
         )
+        if json is not None:
+            # Encode with orjson rather than httpx's stdlib json encoder;
+            # BASE_HEADERS already sets the Content-Type
+            kwargs["content"] = orjson.dumps(json)
+
+        etag_key = None
+        cached = None
+        if method == "GET":
+            # Stringify and sort so list/dict values hash and param order
+            # does not split the cache
+            etag_key = (
+                location_id,
+                endpoint,
+                tuple(sorted((k, str(v)) for k, v in params.items())) if params else (),
+            )
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                # Copy, since cached header dicts are shared between requests
+                headers = {**headers, "If-None-Match": cached[0]}
 
-        if response.status_code >= 400:
+        async with self._semaphore:
+            response = await self.client.request(
+                method=method,
+                url=endpoint,
+                headers=headers,
+                params=params,
+                **kwargs,
+            )
+
+        if response.status_code == 401:
+            # Token was rejected; look it up again on the next request
+            self._header_cache.pop(location_id, None)
+        if response.status_code == 304 and cached is not None:
+            # Unchanged since the cached body; rebuild a response around it
+            etag, content_type, body = cached
+            return httpx.Response(
+                200,
+                headers={"ETag": etag, "Content-Type": content_type},
+                content=body,
+                request=response.request,
+            )
+        if response.status_code >= 400 or response.status_code == 304:
+            # A 304 without a cached body has nothing to return
             handle_api_error(response)
 
-        return response
\ No newline at end of file
+        etag = response.headers.get("ETag") if etag_key is not None else None
+        if etag:
+            content_type = response.headers.get("Content-Type", "application/json")
+            self._etag_cache.set(
+                etag_key, (etag, content_type, response.content), STALE_TTL
+            )
+        return response
+
+    @staticmethod
+    def _params(**params: Any) -> Dict[str, Any]:
+        """Build query params, dropping any that are unset (None)"""
+        return {key: value for key, value in params.items() if value is not None}
+
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body straight from its raw bytes"""
+        return orjson.loads(response.content)
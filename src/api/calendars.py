@@ -1,8 +1,11 @@
 """Calendar and appointment management client for GoHighLevel API v2"""
 
-from typing import Optional, Dict, Any
-from datetime import datetime, date, timedelta
-import pytz
+import asyncio
+from functools import lru_cache
+from typing import Optional, List
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import TypeAdapter
 
 from .base import BaseGoHighLevelClient
 from ..models.calendar import (
@@ -16,6 +19,36 @@ from ..models.calendar import (
     FreeSlotsResult,
 )
 
+# Free slots come back as start times only
+_SLOT_DURATION = timedelta(minutes=30)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+# Validate whole response lists in a single call instead of per item
+_APPOINTMENT_LIST = TypeAdapter(List[Appointment])
+_CALENDAR_LIST = TypeAdapter(List[Calendar])
+
+# Endpoint prefixes; IDs are appended with plain concatenation
+_CONTACTS_PATH = "/contacts/"
+_CALENDARS_PATH = "/calendars/"
+_EVENTS_PATH = "/calendars/events/"
+_APPOINTMENTS_PATH = "/calendars/events/appointments"
+_APPOINTMENT_PATH = _APPOINTMENTS_PATH + "/"
+
+
+@lru_cache(maxsize=1024)
+def _date_to_epoch_ms(day: date, timezone_name: Optional[str] = None) -> int:
+    """Millisecond timestamp of midnight on a date in a timezone
+
+    UTC is used when no timezone is given or the name is not a known zone.
+    """
+    try:
+        tz = ZoneInfo(timezone_name) if timezone_name else dt_timezone.utc
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = dt_timezone.utc
+    return (datetime.combine(day, time.min, tzinfo=tz) - _EPOCH) // _ONE_MS
+
 
 class CalendarsClient(BaseGoHighLevelClient):
     """Client for calendar and appointment endpoints"""
@@ -38,11 +71,18 @@ class CalendarsClient(BaseGoHighLevelClient):
         - 'America/New_York' (Eastern)
         - 'America/Los_Angeles' (Pacific)
         - 'America/Denver' (Mountain)
+
+        Raises:
+            ValueError: If timezone_name is not a known IANA timezone
         """
-        tz = pytz.timezone(timezone_name)
+        try:
+            # ZoneInfo caches instances per key, so repeated lookups are cheap
+            tz = ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {timezone_name!r}") from None
         if dt.tzinfo is None:
             # Naive datetime - localize it
-            dt_aware = tz.localize(dt)
+            dt_aware = dt.replace(tzinfo=tz)
         else:
             # Already aware - convert to target timezone
             dt_aware = dt.astimezone(tz)
@@ -61,13 +101,14 @@ class CalendarsClient(BaseGoHighLevelClient):
         """
         response = await self._request(
             "GET",
-            f"/contacts/{contact_id}/appointments",
+            _CONTACTS_PATH + contact_id + "/appointments",
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
+        appointments = _APPOINTMENT_LIST.validate_python(data.get("events", []))
         return AppointmentList(
-            appointments=[Appointment(**a) for a in data.get("events", [])],
-            count=len(data.get("events", [])),
+            appointments=appointments,
+            count=len(appointments),
             total=data.get("total"),
         )
 
@@ -77,34 +118,42 @@ class CalendarsClient(BaseGoHighLevelClient):
         """Get a specific appointment"""
         response = await self._request(
             "GET",
-            f"/calendars/events/appointments/{appointment_id}",
+            _APPOINTMENT_PATH + appointment_id,
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
         return Appointment(**data.get("appointment", data))
 
+    async def get_appointments_many(
+        self, appointment_ids: List[str], location_id: str
+    ) -> List[Appointment]:
+        """Get several appointments by ID concurrently
+
+        The requests are bounded by the client's request semaphore and
+        multiplex over the shared HTTP/2 connection. Results are returned
+        in the same order as appointment_ids.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_appointment(appointment_id, location_id)
+                    for appointment_id in appointment_ids
+                )
+            )
+        )
+
     async def create_appointment(self, appointment: AppointmentCreate) -> Appointment:
         """Create a new appointment"""
-        # Convert datetime objects to ISO strings for the API
+        # The model serializes datetimes to ISO strings for the API
         appointment_data = appointment.model_dump(exclude_none=True)
 
-        # Handle datetime serialization
-        if "startTime" in appointment_data and isinstance(
-            appointment_data["startTime"], datetime
-        ):
-            appointment_data["startTime"] = appointment_data["startTime"].isoformat()
-        if "endTime" in appointment_data and isinstance(
-            appointment_data["endTime"], datetime
-        ):
-            appointment_data["endTime"] = appointment_data["endTime"].isoformat()
-
         response = await self._request(
             "POST",
-            "/calendars/events/appointments",
+            _APPOINTMENTS_PATH,
             json=appointment_data,
             location_id=appointment.locationId,
         )
-        data = response.json()
+        data = self._json(response)
 
         # The API returns a minimal response when creating appointments
         # We need to merge it with the original request data to create a complete Appointment object
@@ -130,32 +179,24 @@ class CalendarsClient(BaseGoHighLevelClient):
         self, appointment_id: str, updates: AppointmentUpdate, location_id: str
     ) -> Appointment:
         """Update an existing appointment"""
-        # Convert datetime objects to ISO strings for the API
+        # The model serializes datetimes to ISO strings for the API
         update_data = updates.model_dump(exclude_none=True)
 
-        # Handle datetime serialization
-        if "startTime" in update_data and isinstance(
-            update_data["startTime"], datetime
-        ):
-            update_data["startTime"] = update_data["startTime"].isoformat()
-        if "endTime" in update_data and isinstance(update_data["endTime"], datetime):
-            update_data["endTime"] = update_data["endTime"].isoformat()
-
         response = await self._request(
             "PUT",
-            f"/calendars/events/appointments/{appointment_id}",
+            _APPOINTMENT_PATH + appointment_id,
             json=update_data,
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
         return Appointment(**data.get("appointment", data))
 
     async def delete_appointment(self, appointment_id: str, location_id: str) -> bool:
         """Delete an appointment"""
         response = await self._request(
-            "DELETE", f"/calendars/events/{appointment_id}", location_id=location_id
+            "DELETE", _EVENTS_PATH + appointment_id, location_id=location_id
         )
-        return response.status_code == 200
+        return 200 <= response.status_code < 300
 
     # Calendar Methods
 
@@ -163,23 +204,24 @@ class CalendarsClient(BaseGoHighLevelClient):
         """Get all calendars for a location"""
         response = await self._request(
             "GET",
-            "/calendars/",
+            _CALENDARS_PATH,
             params={"locationId": location_id},
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
+        calendars = _CALENDAR_LIST.validate_python(data.get("calendars", []))
         return CalendarList(
-            calendars=[Calendar(**c) for c in data.get("calendars", [])],
-            count=len(data.get("calendars", [])),
+            calendars=calendars,
+            count=len(calendars),
             total=data.get("total"),
         )
 
     async def get_calendar(self, calendar_id: str, location_id: str) -> Calendar:
         """Get a specific calendar"""
         response = await self._request(
-            "GET", f"/calendars/{calendar_id}", location_id=location_id
+            "GET", _CALENDARS_PATH + calendar_id, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
         return Calendar(**data.get("calendar", data))
 
     async def get_free_slots(
@@ -191,53 +233,41 @@ class CalendarsClient(BaseGoHighLevelClient):
         timezone: Optional[str] = None,
     ) -> FreeSlotsResult:
         """Get available time slots for a calendar"""
-        # Convert dates to millisecond timestamps
-        start_timestamp = int(
-            datetime.combine(start_date, datetime.min.time()).timestamp() * 1000
-        )
-
-        params: Dict[str, Any] = {
-            "startDate": start_timestamp,
-        }
-
-        if end_date:
-            end_timestamp = int(
-                datetime.combine(end_date, datetime.min.time()).timestamp() * 1000
-            )
-            params["endDate"] = end_timestamp
-        if timezone:
-            params["timezone"] = timezone
+        # Convert dates to millisecond timestamps of midnight in the requested timezone
+        start_timestamp = _date_to_epoch_ms(start_date, timezone)
+        end_timestamp = _date_to_epoch_ms(end_date, timezone) if end_date else None
 
         # Note: Do NOT include locationId in params - it uses the token's location
+        params = self._params(
+            startDate=start_timestamp,
+            endDate=end_timestamp,
+            timezone=timezone or None,
+        )
         response = await self._request(
             "GET",
-            f"/calendars/{calendar_id}/free-slots",
+            _CALENDARS_PATH + calendar_id + "/free-slots",
             params=params,
             location_id=location_id,  # This is for token selection, not query params
         )
-        data = response.json()
+        data = self._json(response)
 
         # The response format is different - it's organized by date
         # Example: {"2025-06-10": {"slots": [...]}}
-        all_slots = []
-        for date_key, date_data in data.items():
-            if (
-                date_key != "traceId"
-                and isinstance(date_data, dict)
-                and "slots" in date_data
-            ):
-                for slot_time in date_data.get("slots", []):
-                    # Each slot is just a timestamp string like "2025-06-10T11:00:00-05:00"
-                    # We need to create start and end times (assuming 30-minute slots)
-                    slot_dt = datetime.fromisoformat(slot_time.replace("Z", "+00:00"))
-                    end_dt = slot_dt + timedelta(minutes=30)
-                    all_slots.append(
-                        FreeSlot(
-                            startTime=slot_time,
-                            endTime=end_dt.isoformat(),
-                            available=True,
-                        )
-                    )
+        # Each slot is just a timestamp string like "2025-06-10T11:00:00-05:00"
+        slot_starts = [
+            datetime.fromisoformat(slot_time)
+            for date_key, date_data in data.items()
+            if date_key != "traceId" and isinstance(date_data, dict)
+            for slot_time in date_data.get("slots", [])
+        ]
+        # We need to create start and end times (assuming 30-minute slots).
+        # The datetimes are built here, so skip re-validating them
+        all_slots = [
+            FreeSlot.model_construct(
+                startTime=slot_dt, endTime=slot_dt + _SLOT_DURATION, available=True
+            )
+            for slot_dt in slot_starts
+        ]
 
         return FreeSlotsResult(
             slots=all_slots,
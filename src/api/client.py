@@ -1,9 +1,33 @@
 """Main GoHighLevel API v2 client with composition pattern"""
 
-from typing import Any, Dict, Optional, List
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from datetime import date
+import httpx
 
 from ..services.oauth import OAuthService
+from ..utils.cache import (
+    LONG_TTL,
+    NORMAL_TTL,
+    STALE_TTL,
+    SingleFlight,
+    TTLCache,
+    cached,
+    single_flight,
+)
+from ..utils.exceptions import is_upstream_failure
+from ..utils.pagination import paginate
 from ..models.contact import Contact, ContactCreate, ContactUpdate, ContactList
 from ..models.conversation import (
     Conversation,
@@ -36,12 +60,15 @@ from ..models.form import (
     FormFileUploadRequest,
 )
 
+from .base import BaseGoHighLevelClient
 from .contacts import ContactsClient
 from .conversations import ConversationsClient
 from .opportunities import OpportunitiesClient
 from .calendars import CalendarsClient
 from .forms import FormsClient
 
+T = TypeVar("T")
+
 
 class GoHighLevelClient:
     """Main client for interacting with GoHighLevel API v2
@@ -50,50 +77,103 @@ class GoHighLevelClient:
     while maintaining the same public interface for backward compatibility.
     """
 
-    def __init__(self, oauth_service: OAuthService):
+    def __init__(
+        self,
+        oauth_service: OAuthService,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
         self.oauth_service = oauth_service
 
+        # A single connection pool and concurrency limit shared by all
+        # specialized clients, optionally borrowed from another client
+        self._owns_client = client is None
+        self.client = (
+            client if client is not None else BaseGoHighLevelClient.create_http_client()
+        )
+        self._semaphore = semaphore or asyncio.Semaphore(
+            BaseGoHighLevelClient.MAX_CONCURRENT_REQUESTS
+        )
+
         # Initialize specialized clients
-        self._contacts = ContactsClient(oauth_service)
-        self._conversations = ConversationsClient(oauth_service)
-        self._opportunities = OpportunitiesClient(oauth_service)
-        self._calendars = CalendarsClient(oauth_service)
-        self._forms = FormsClient(oauth_service)
+        self._contacts = ContactsClient(oauth_service, self.client, self._semaphore)
+        self._conversations = ConversationsClient(
+            oauth_service, self.client, self._semaphore
+        )
+        self._opportunities = OpportunitiesClient(
+            oauth_service, self.client, self._semaphore
+        )
+        self._calendars = CalendarsClient(oauth_service, self.client, self._semaphore)
+        self._forms = FormsClient(oauth_service, self.client, self._semaphore)
+
+        # Results of rarely-changing reads, see the @cached methods below,
+        # and identical reads currently in flight
+        self._cache = TTLCache()
+        self._inflight = SingleFlight()
+
+    @property
+    def _endpoint_clients(self) -> Tuple[BaseGoHighLevelClient, ...]:
+        """All specialized endpoint clients"""
+        return (
+            self._contacts,
+            self._conversations,
+            self._opportunities,
+            self._calendars,
+            self._forms,
+        )
 
     async def __aenter__(self):
-        # Enter all specialized clients
-        await self._contacts.__aenter__()
-        await self._conversations.__aenter__()
-        await self._opportunities.__aenter__()
-        await self._calendars.__aenter__()
-        await self._forms.__aenter__()
+        # Enter all specialized clients concurrently
+        await asyncio.gather(*(c.__aenter__() for c in self._endpoint_clients))
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        # Exit all specialized clients
-        await self._contacts.__aexit__(exc_type, exc_val, exc_tb)
-        await self._conversations.__aexit__(exc_type, exc_val, exc_tb)
-        await self._opportunities.__aexit__(exc_type, exc_val, exc_tb)
-        await self._calendars.__aexit__(exc_type, exc_val, exc_tb)
-        await self._forms.__aexit__(exc_type, exc_val, exc_tb)
+        # Exit all specialized clients, even if one of them fails
+        results = await asyncio.gather(
+            *(c.__aexit__(exc_type, exc_val, exc_tb) for c in self._endpoint_clients),
+            return_exceptions=True,
+        )
+        if self._owns_client:
+            await self.client.aclose()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def run_many(
+        self, calls: Iterable[Awaitable[T]]
+    ) -> List[Union[T, BaseException]]:
+        """Run independent API calls concurrently
+
+        Results come back in call order; a failed call yields its exception
+        instead of cancelling the rest. In-flight requests are bounded by
+        the shared request semaphore. For example::
+
+            contacts = await client.run_many(
+                client.get_contact(contact_id, location_id) for contact_id in ids
+            )
+        """
+        return await asyncio.gather(*calls, return_exceptions=True)
 
     # Location Methods (keeping these in main client for now)
 
+    @cached(LONG_TTL, STALE_TTL, is_upstream_failure)
     async def get_locations(self, limit: int = 100, skip: int = 0) -> Dict[str, Any]:
         """Get all locations"""
         # Use the first available client for the request
         response = await self._contacts._request(
             "GET", "/locations/search", params={"limit": limit, "skip": skip}
         )
-        return response.json()
+        return self._contacts._json(response)
 
+    @cached(LONG_TTL, STALE_TTL, is_upstream_failure)
     async def get_location(self, location_id: str) -> Dict[str, Any]:
         """Get a specific location"""
-        response = await self._contacts._request("GET", f"/locations/{location_id}")
-        return response.json()
+        response = await self._contacts._request("GET", "/locations/" + location_id)
+        return self._contacts._json(response)
 
     # Contact Methods - Delegate to ContactsClient
 
+    @single_flight
     async def get_contacts(
         self,
         location_id: str,
@@ -115,6 +195,34 @@ class GoHighLevelClient:
             tags=tags,
         )
 
+    def iter_contacts(
+        self,
+        location_id: str,
+        page_size: int = 100,
+        concurrency: int = 4,
+        query: Optional[str] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> AsyncIterator[Contact]:
+        """Iterate over all matching contacts, fetching pages concurrently"""
+        return paginate(
+            lambda skip: self._contacts.get_contacts(
+                location_id=location_id,
+                limit=page_size,
+                skip=skip,
+                query=query,
+                email=email,
+                phone=phone,
+                tags=tags,
+            ),
+            lambda page: page.contacts,
+            lambda page: page.total,
+            page_size,
+            concurrency,
+        )
+
+    @single_flight
     async def get_contact(self, contact_id: str, location_id: str) -> Contact:
         """Get a specific contact"""
         return await self._contacts.get_contact(contact_id, location_id)
@@ -147,6 +255,7 @@ class GoHighLevelClient:
 
     # Conversation Methods - Delegate to ConversationsClient
 
+    @single_flight
     async def get_conversations(
         self,
         location_id: str,
@@ -166,6 +275,32 @@ class GoHighLevelClient:
             unread_only=unread_only,
         )
 
+    def iter_conversations(
+        self,
+        location_id: str,
+        page_size: int = 100,
+        concurrency: int = 4,
+        contact_id: Optional[str] = None,
+        starred: Optional[bool] = None,
+        unread_only: Optional[bool] = None,
+    ) -> AsyncIterator[Conversation]:
+        """Iterate over all matching conversations, fetching pages concurrently"""
+        return paginate(
+            lambda skip: self._conversations.get_conversations(
+                location_id=location_id,
+                limit=page_size,
+                skip=skip,
+                contact_id=contact_id,
+                starred=starred,
+                unread_only=unread_only,
+            ),
+            lambda page: page.conversations,
+            lambda page: page.total,
+            page_size,
+            concurrency,
+        )
+
+    @single_flight
     async def get_conversation(
         self, conversation_id: str, location_id: str
     ) -> Conversation:
@@ -178,6 +313,7 @@ class GoHighLevelClient:
         """Create a new conversation"""
         return await self._conversations.create_conversation(conversation)
 
+    @single_flight
     async def get_messages(
         self, conversation_id: str, location_id: str, limit: int = 100, skip: int = 0
     ) -> MessageList:
@@ -186,6 +322,21 @@ class GoHighLevelClient:
             conversation_id, location_id, limit, skip
         )
 
+    def iter_messages(
+        self, conversation_id: str, location_id: str, page_size: int = 100
+    ) -> AsyncIterator[Message]:
+        """Iterate over all messages in a conversation"""
+        # The nested messages response does not carry a reliable total, so
+        # pages are fetched one at a time until a short page comes back
+        return paginate(
+            lambda skip: self._conversations.get_messages(
+                conversation_id, location_id, page_size, skip
+            ),
+            lambda page: page.messages,
+            lambda page: None,
+            page_size,
+        )
+
     async def send_message(
         self, conversation_id: str, message: MessageCreate, location_id: str
     ) -> Message:
@@ -204,6 +355,7 @@ class GoHighLevelClient:
 
     # Opportunity Methods - Delegate to OpportunitiesClient
 
+    @single_flight
     async def get_opportunities(
         self,
         location_id: str,
@@ -216,6 +368,7 @@ class GoHighLevelClient:
             location_id=location_id, limit=limit, skip=skip, filters=filters
         )
 
+    @single_flight
     async def get_opportunity(
         self, opportunity_id: str, location_id: str
     ) -> Opportunity:
@@ -246,6 +399,7 @@ class GoHighLevelClient:
             opportunity_id, status, location_id
         )
 
+    @cached(LONG_TTL, STALE_TTL, is_upstream_failure)
     async def get_pipelines(self, location_id: str) -> List[Pipeline]:
         """Get all pipelines for a location
 
@@ -256,6 +410,7 @@ class GoHighLevelClient:
 
     # Calendar Methods - Delegate to CalendarsClient
 
+    @single_flight
     async def get_appointments(
         self,
         contact_id: str,
@@ -267,12 +422,19 @@ class GoHighLevelClient:
             location_id=location_id,
         )
 
+    @single_flight
     async def get_appointment(
         self, appointment_id: str, location_id: str
     ) -> Appointment:
         """Get a specific appointment"""
         return await self._calendars.get_appointment(appointment_id, location_id)
 
+    async def get_appointments_many(
+        self, appointment_ids: List[str], location_id: str
+    ) -> List[Appointment]:
+        """Get several appointments by ID concurrently"""
+        return await self._calendars.get_appointments_many(appointment_ids, location_id)
+
     async def create_appointment(self, appointment: AppointmentCreate) -> Appointment:
         """Create a new appointment"""
         return await self._calendars.create_appointment(appointment)
@@ -289,10 +451,12 @@ class GoHighLevelClient:
         """Delete an appointment"""
         return await self._calendars.delete_appointment(appointment_id, location_id)
 
+    @cached(NORMAL_TTL, STALE_TTL, is_upstream_failure, max_ttl=LONG_TTL)
     async def get_calendars(self, location_id: str) -> CalendarList:
         """Get all calendars for a location"""
         return await self._calendars.get_calendars(location_id)
 
+    @cached(NORMAL_TTL, max_ttl=LONG_TTL)
     async def get_calendar(self, calendar_id: str, location_id: str) -> Calendar:
         """Get a specific calendar"""
         return await self._calendars.get_calendar(calendar_id, location_id)
@@ -312,6 +476,7 @@ class GoHighLevelClient:
 
     # Form Methods - Delegate to FormsClient
 
+    @cached(NORMAL_TTL, STALE_TTL, is_upstream_failure, max_ttl=LONG_TTL)
     async def get_forms(
         self, location_id: str, limit: int = 100, skip: int = 0
     ) -> FormList:
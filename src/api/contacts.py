@@ -1,14 +1,34 @@
 """Contact management client for GoHighLevel API v2"""
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
+import httpx
+from pydantic import TypeAdapter
 
 from .base import BaseGoHighLevelClient
 from ..models.contact import Contact, ContactCreate, ContactUpdate, ContactList
+from ..services.oauth import OAuthService
+
+# Validate whole response lists in a single call instead of per item
+_CONTACT_LIST = TypeAdapter(List[Contact])
+
+# Endpoint prefix; IDs are appended with plain concatenation
+_CONTACT_PATH = "/contacts/"
 
 
 class ContactsClient(BaseGoHighLevelClient):
     """Client for contact-related endpoints"""
 
+    def __init__(
+        self,
+        oauth_service: OAuthService,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(oauth_service, client, semaphore)
+        # Contact fetches scheduled after tag changes, not yet started
+        self._pending_refreshes: Dict[Tuple[str, str], "asyncio.Future[Contact]"] = {}
+
     async def get_contacts(
         self,
         location_id: str,
@@ -20,28 +40,25 @@ class ContactsClient(BaseGoHighLevelClient):
         tags: Optional[List[str]] = None,
     ) -> ContactList:
         """Get contacts for a location"""
-        params = {"locationId": location_id, "limit": limit}
-
-        # Only add skip if it's greater than 0
-        if skip > 0:
-            params["skip"] = skip
-
-        if query:
-            params["query"] = query
-        if email:
-            params["email"] = email
-        if phone:
-            params["phone"] = phone
-        if tags:
-            params["tags"] = ",".join(tags)
+        # Only send skip if it's greater than 0, and filters if they're set
+        params = self._params(
+            locationId=location_id,
+            limit=limit,
+            skip=skip if skip > 0 else None,
+            query=query or None,
+            email=email or None,
+            phone=phone or None,
+            tags=",".join(tags) if tags else None,
+        )
 
         response = await self._request(
             "GET", "/contacts", params=params, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
+        contacts = data.get("contacts", [])
         return ContactList(
-            contacts=[Contact(**c) for c in data.get("contacts", [])],
-            count=len(data.get("contacts", [])),
+            contacts=_CONTACT_LIST.validate_python(contacts),
+            count=len(contacts),
             total=data.get("meta", {}).get("total") or data.get("total"),
             meta=data.get("meta"),
             traceId=data.get("traceId"),
@@ -50,9 +67,9 @@ class ContactsClient(BaseGoHighLevelClient):
     async def get_contact(self, contact_id: str, location_id: str) -> Contact:
         """Get a specific contact"""
         response = await self._request(
-            "GET", f"/contacts/{contact_id}", location_id=location_id
+            "GET", _CONTACT_PATH + contact_id, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
         return Contact(**data.get("contact", data))
 
     async def create_contact(self, contact: ContactCreate) -> Contact:
@@ -60,10 +77,10 @@ class ContactsClient(BaseGoHighLevelClient):
         response = await self._request(
             "POST",
             "/contacts",
-            json=contact.model_dump(exclude_none=True),
+            content=contact.model_dump_json(exclude_none=True),
             location_id=contact.locationId,
         )
-        data = response.json()
+        data = self._json(response)
         return Contact(**data.get("contact", data))
 
     async def update_contact(
@@ -72,17 +89,17 @@ class ContactsClient(BaseGoHighLevelClient):
         """Update an existing contact"""
         response = await self._request(
             "PUT",
-            f"/contacts/{contact_id}",
-            json=updates.model_dump(exclude_none=True),
+            _CONTACT_PATH + contact_id,
+            content=updates.model_dump_json(exclude_none=True),
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
         return Contact(**data.get("contact", data))
 
     async def delete_contact(self, contact_id: str, location_id: str) -> bool:
         """Delete a contact"""
         response = await self._request(
-            "DELETE", f"/contacts/{contact_id}", location_id=location_id
+            "DELETE", _CONTACT_PATH + contact_id, location_id=location_id
         )
         return response.status_code == 200
 
@@ -92,13 +109,13 @@ class ContactsClient(BaseGoHighLevelClient):
         """Add tags to a contact"""
         await self._request(
             "POST",
-            f"/contacts/{contact_id}/tags",
+            _CONTACT_PATH + contact_id + "/tags",
             json={"tags": tags},
             location_id=location_id,
         )
         # Tags endpoint returns {tags: [...], tagsAdded: [...]}
         # Need to fetch the updated contact
-        return await self.get_contact(contact_id, location_id)
+        return await self._refresh_contact(contact_id, location_id)
 
     async def remove_contact_tags(
         self, contact_id: str, tags: List[str], location_id: str
@@ -106,10 +123,30 @@ class ContactsClient(BaseGoHighLevelClient):
         """Remove tags from a contact"""
         await self._request(
             "DELETE",
-            f"/contacts/{contact_id}/tags",
+            _CONTACT_PATH + contact_id + "/tags",
             json={"tags": tags},
             location_id=location_id,
         )
         # Tags endpoint returns {tags: [...], tagsRemoved: [...]}
         # Need to fetch the updated contact
-        return await self.get_contact(contact_id, location_id)
\ No newline at end of file
+        return await self._refresh_contact(contact_id, location_id)
+
+    async def _refresh_contact(self, contact_id: str, location_id: str) -> Contact:
+        """Fetch a contact after a tag change
+
+        Tag changes on the same contact that finish together share one fetch.
+        A fetch that has already started is never joined, so every caller
+        sees a contact read after its own change.
+        """
+        key = (contact_id, location_id)
+        refresh = self._pending_refreshes.get(key)
+        if refresh is None:
+            refresh = asyncio.ensure_future(self._fetch_pending_refresh(key))
+            self._pending_refreshes[key] = refresh
+        return await asyncio.shield(refresh)
+
+    async def _fetch_pending_refresh(self, key: Tuple[str, str]) -> Contact:
+        # Give tag changes finishing in this loop iteration a chance to join
+        await asyncio.sleep(0)
+        del self._pending_refreshes[key]
+        return await self.get_contact(*key)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Conversation and messaging client for GoHighLevel API v2"""
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import TypeAdapter
 
 from .base import BaseGoHighLevelClient
 from ..models.conversation import (
@@ -10,8 +11,31 @@ from ..models.conversation import (
     Message,
     MessageCreate,
     MessageList,
+    MessageType,
 )
 
+# Validate whole response lists in a single call instead of per item
+_CONVERSATION_LIST = TypeAdapter(List[Conversation])
+_MESSAGE_LIST = TypeAdapter(List[Message])
+
+# Endpoint prefix; IDs are appended with plain concatenation
+_CONVERSATION_PATH = "/conversations/"
+
+# Numeric message type reported back for sent messages; anything else is 0
+_MESSAGE_TYPE_CODES = {MessageType.SMS: 1, MessageType.EMAIL: 2}
+
+
+def _unwrap_messages(data: Dict[str, Any]) -> Tuple[List[Any], Optional[int]]:
+    """Extract the message items and total from a messages response"""
+    messages = data.get("messages")
+    # Handle nested response structure
+    if isinstance(messages, dict):
+        # Messages are nested under messages.messages
+        messages_data = messages.get("messages", [])
+        return messages_data, len(messages_data)  # or messages.get("total")
+    # Direct array of messages
+    return messages or [], data.get("total")
+
 
 class ConversationsClient(BaseGoHighLevelClient):
     """Client for conversation and messaging endpoints"""
@@ -26,24 +50,23 @@ class ConversationsClient(BaseGoHighLevelClient):
         unread_only: Optional[bool] = None,
     ) -> ConversationList:
         """Get conversations for a location"""
-        params = {"location_id": location_id, "limit": limit}
-
-        if skip > 0:
-            params["skip"] = skip
-        if contact_id:
-            params["contactId"] = contact_id
-        if starred is not None:
-            params["starred"] = starred
-        if unread_only is not None:
-            params["unreadOnly"] = unread_only
+        params = self._params(
+            location_id=location_id,
+            limit=limit,
+            skip=skip if skip > 0 else None,
+            contactId=contact_id or None,
+            starred=starred,
+            unreadOnly=unread_only,
+        )
 
         response = await self._request(
             "GET", "/conversations/search", params=params, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
+        conversations = data.get("conversations", [])
         return ConversationList(
-            conversations=[Conversation(**c) for c in data.get("conversations", [])],
-            count=len(data.get("conversations", [])),
+            conversations=_CONVERSATION_LIST.validate_python(conversations),
+            count=len(conversations),
             total=data.get("total"),
         )
 
@@ -52,11 +75,10 @@ class ConversationsClient(BaseGoHighLevelClient):
     ) -> Conversation:
         """Get a specific conversation"""
         response = await self._request(
-            "GET", f"/conversations/{conversation_id}", location_id=location_id
+            "GET", _CONVERSATION_PATH + conversation_id, location_id=location_id
         )
-        data = response.json()
         # API returns the conversation directly, not wrapped
-        return Conversation(**data)
+        return Conversation.model_validate_json(response.content)
 
     async def create_conversation(
         self, conversation: ConversationCreate
@@ -65,40 +87,27 @@ class ConversationsClient(BaseGoHighLevelClient):
         response = await self._request(
             "POST",
             "/conversations",
-            json=conversation.model_dump(exclude_none=True),
+            content=conversation.model_dump_json(exclude_none=True),
             location_id=conversation.locationId,
         )
-        data = response.json()
+        data = self._json(response)
         return Conversation(**data.get("conversation", data))
 
     async def get_messages(
         self, conversation_id: str, location_id: str, limit: int = 100, skip: int = 0
     ) -> MessageList:
         """Get messages for a conversation"""
-        params = {"limit": limit}
-
-        if skip > 0:
-            params["skip"] = skip
+        params = self._params(limit=limit, skip=skip if skip > 0 else None)
 
         response = await self._request(
             "GET",
-            f"/conversations/{conversation_id}/messages",
+            _CONVERSATION_PATH + conversation_id + "/messages",
             params=params,
             location_id=location_id,
         )
-        data = response.json()
-        # Handle nested response structure
-        if isinstance(data.get("messages"), dict):
-            # Messages are nested under messages.messages
-            messages_data = data["messages"].get("messages", [])
-            total = len(messages_data)  # or data["messages"].get("total")
-        else:
-            # Direct array of messages
-            messages_data = data.get("messages", [])
-            total = data.get("total")
-
+        messages_data, total = _unwrap_messages(self._json(response))
         return MessageList(
-            messages=[Message(**m) for m in messages_data if isinstance(m, dict)],
+            messages=_MESSAGE_LIST.validate_python(messages_data),
             count=len(messages_data),
             total=total,
         )
@@ -107,25 +116,20 @@ class ConversationsClient(BaseGoHighLevelClient):
         self, conversation_id: str, message: MessageCreate, location_id: str
     ) -> Message:
         """Send a message in a conversation"""
-        # Extract phone from message if present
-        message_data = message.model_dump(exclude_none=True)
-        phone = message_data.pop("phone", None)
-
-        # Build payload with phone at top level if needed
-        payload = {"conversationId": conversation_id, **message_data}
-        if phone:
-            # Try different field names the API might expect
-            payload["phoneNumber"] = phone  # Try phoneNumber instead of phone
+        # The dump is a fresh dict, so build the payload in place;
+        # by_alias sends phone as phoneNumber, and only when it is non-empty
+        payload = message.model_dump(exclude_none=True, by_alias=True)
+        if not message.phone:
+            payload.pop("phoneNumber", None)
+        payload["conversationId"] = conversation_id
 
         response = await self._request(
             "POST", "/conversations/messages", json=payload, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
         # API returns {conversationId, messageId} for sent messages
         # Convert message type to int for the response
-        message_type_int = (
-            1 if message.type == "SMS" else 2 if message.type == "Email" else 0
-        )
+        message_type_int = _MESSAGE_TYPE_CODES.get(message.type, 0)
         return Message(
             id=data.get("messageId", data.get("id", "unknown")),
             conversationId=data.get("conversationId", conversation_id),
@@ -2,6 +2,7 @@
 
 from typing import Optional, Dict, Any
 import base64
+import io
 
 from .base import BaseGoHighLevelClient
 from ..models.form import (
@@ -10,6 +11,30 @@ from ..models.form import (
     FormFileUploadRequest,
 )
 
+# Characters of base64 decoded per step
+_BASE64_CHUNK = 64 * 1024
+
+
+def _decode_base64_file(content: str) -> io.BytesIO:
+    """Decode base64 content chunk by chunk into a rewound in-memory file
+
+    Kept in memory: httpx calls fileno() on uploads to size them, which
+    would push a spooled temporary file to disk on every upload.
+    """
+    file_obj = io.BytesIO()
+    pending = b""
+    for start in range(0, len(content), _BASE64_CHUNK):
+        # Drop line breaks and keep whole 4-character groups for the next step
+        chunk = pending + b"".join(
+            content[start : start + _BASE64_CHUNK].encode("ascii").split()
+        )
+        usable = len(chunk) - len(chunk) % 4
+        file_obj.write(base64.b64decode(chunk[:usable]))
+        pending = chunk[usable:]
+    file_obj.write(base64.b64decode(pending))
+    file_obj.seek(0)
+    return file_obj
+
 
 class FormsClient(BaseGoHighLevelClient):
     """Client for forms-related endpoints of GoHighLevel API v2"""
@@ -27,16 +52,16 @@ class FormsClient(BaseGoHighLevelClient):
         Returns:
             FormList with forms
         """
-        params = {"locationId": location_id, "limit": limit}
-        if skip > 0:
-            params["skip"] = skip
+        params = self._params(
+            locationId=location_id, limit=limit, skip=skip if skip > 0 else None
+        )
 
         response = await self._request(
             "GET", "/forms/", params=params, location_id=location_id
         )
 
-        data = response.json()
-        return FormList(**data)
+        # The response body is the FormList shape, so parse it in one pass
+        return FormList.model_validate_json(response.content)
 
     # NOTE: GET /forms/{id} is not supported by the API
     # Returns 401: "This route is not yet supported by the IAM Service"
@@ -68,24 +93,21 @@ class FormsClient(BaseGoHighLevelClient):
         Returns:
             FormSubmissionList with submissions
         """
-        params = {"locationId": location_id, "limit": limit}
-        if skip > 0:
-            params["skip"] = skip
-        if form_id:
-            params["formId"] = form_id
-        if contact_id:
-            params["contactId"] = contact_id
-        if start_date:
-            params["startDate"] = start_date
-        if end_date:
-            params["endDate"] = end_date
+        params = self._params(
+            locationId=location_id,
+            limit=limit,
+            skip=skip if skip > 0 else None,
+            formId=form_id or None,
+            contactId=contact_id or None,
+            startDate=start_date or None,
+            endDate=end_date or None,
+        )
 
         response = await self._request(
             "GET", "/forms/submissions", params=params, location_id=location_id
         )
 
-        data = response.json()
-        return FormSubmissionList(**data)
+        return FormSubmissionList.model_validate_json(response.content)
 
     # NOTE: Form submission endpoints have been removed
     # POST /forms/submit returns 401 Unauthorized and needs further investigation
@@ -102,35 +124,40 @@ class FormsClient(BaseGoHighLevelClient):
         Returns:
             Upload response
         """
-        # Decode base64 file content
-        file_content = base64.b64decode(file_upload.fileContent)
-
-        # Prepare multipart form data
-        files = {
-            "file": (file_upload.fileName, file_content, file_upload.contentType),
-        }
         data = {
             "fieldId": file_upload.fieldId,
         }
 
         # Override headers to remove Content-Type (httpx will set it with boundary)
-        headers = await self._get_headers(file_upload.locationId)
-        headers.pop("Content-Type", None)
-
-        response = await self.client.post(
-            f"{self.API_BASE_URL}/forms/upload-custom-files",
-            params={
-                "contactId": file_upload.contactId,
-                "locationId": file_upload.locationId,
-            },
-            files=files,
-            data=data,
-            headers=headers,
-        )
+        # Build a new dict, since cached header dicts are shared between requests
+        location_headers = self._cached_headers(
+            file_upload.locationId
+        ) or await self._get_headers(file_upload.locationId)
+        headers = {
+            key: value
+            for key, value in location_headers.items()
+            if key != "Content-Type"
+        }
+
+        # Decode base64 file content; httpx reads the file as it sends the body
+        with _decode_base64_file(file_upload.fileContent) as file_content:
+            files = {
+                "file": (file_upload.fileName, file_content, file_upload.contentType),
+            }
+            response = await self.client.post(
+                f"{self.API_BASE_URL}/forms/upload-custom-files",
+                params={
+                    "contactId": file_upload.contactId,
+                    "locationId": file_upload.locationId,
+                },
+                files=files,
+                data=data,
+                headers=headers,
+            )
 
         if response.status_code >= 400:
             from ..utils.exceptions import handle_api_error
 
             handle_api_error(response)
 
-        return response.json()
\ No newline at end of file
+        return self._json(response)
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Opportunity and pipeline management client for GoHighLevel API v2"""
 
+from datetime import datetime
 from typing import List, Optional
+from pydantic import TypeAdapter
 
 from .base import BaseGoHighLevelClient
 from ..models.opportunity import (
@@ -12,6 +14,13 @@ from ..models.opportunity import (
     Pipeline,
 )
 
+# Validate whole response lists in a single call instead of per item
+_OPPORTUNITY_LIST = TypeAdapter(List[Opportunity])
+_PIPELINE_LIST = TypeAdapter(List[Pipeline])
+
+# Endpoint prefix; IDs are appended with plain concatenation
+_OPPORTUNITY_PATH = "/opportunities/"
+
 
 class OpportunitiesClient(BaseGoHighLevelClient):
     """Client for opportunity and pipeline endpoints"""
@@ -24,25 +33,27 @@ class OpportunitiesClient(BaseGoHighLevelClient):
         filters: Optional[OpportunitySearchFilters] = None,
     ) -> OpportunitySearchResult:
         """Get opportunities for a location"""
-        params = {"location_id": location_id, "limit": limit}
-
-        if skip > 0:
-            params["skip"] = skip
+        params = self._params(
+            location_id=location_id,
+            limit=limit,
+            skip=skip if skip > 0 else None,
+        )
 
         if filters:
-            filter_data = filters.model_dump(exclude_none=True)
-            for key, value in filter_data.items():
-                if key in ["startDate", "endDate"] and value:
-                    params[key] = value.isoformat()
-                elif value is not None:
-                    params[key] = value
+            # Date range filters are sent as ISO strings
+            params.update(
+                (key, value.isoformat() if isinstance(value, datetime) else value)
+                for key, value in filters.model_dump(exclude_none=True).items()
+            )
 
         response = await self._request(
             "GET", "/opportunities/search", params=params, location_id=location_id
         )
-        data = response.json()
+        data = self._json(response)
         return OpportunitySearchResult(
-            opportunities=[Opportunity(**o) for o in data.get("opportunities", [])],
+            opportunities=_OPPORTUNITY_LIST.validate_python(
+                data.get("opportunities", [])
+            ),
             meta=data.get("meta"),
             aggregations=data.get("aggregations"),
         )
@@ -53,11 +64,11 @@ class OpportunitiesClient(BaseGoHighLevelClient):
         """Get a specific opportunity"""
         response = await self._request(
             "GET",
-            f"/opportunities/{opportunity_id}",
+            _OPPORTUNITY_PATH + opportunity_id,
             params={"locationId": location_id},
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
         return Opportunity(**data.get("opportunity", data))
 
     async def create_opportunity(self, opportunity: OpportunityCreate) -> Opportunity:
@@ -65,10 +76,10 @@ class OpportunitiesClient(BaseGoHighLevelClient):
         response = await self._request(
             "POST",
             "/opportunities/",  # Note: API requires trailing slash
-            json=opportunity.model_dump(exclude_none=True),
+            content=opportunity.model_dump_json(exclude_none=True),
             location_id=opportunity.locationId,
         )
-        data = response.json()
+        data = self._json(response)
         return Opportunity(**data.get("opportunity", data))
 
     async def update_opportunity(
@@ -77,18 +88,18 @@ class OpportunitiesClient(BaseGoHighLevelClient):
         """Update an existing opportunity"""
         response = await self._request(
             "PUT",
-            f"/opportunities/{opportunity_id}",
-            json=updates.model_dump(exclude_none=True),
+            _OPPORTUNITY_PATH + opportunity_id,
+            content=updates.model_dump_json(exclude_none=True),
             location_id=location_id,
         )
-        data = response.json()
+        data = self._json(response)
         return Opportunity(**data.get("opportunity", data))
 
     async def delete_opportunity(self, opportunity_id: str, location_id: str) -> bool:
         """Delete an opportunity"""
         response = await self._request(
             "DELETE",
-            f"/opportunities/{opportunity_id}",
+            _OPPORTUNITY_PATH + opportunity_id,
             params={"locationId": location_id},
             location_id=location_id,
         )
@@ -100,7 +111,7 @@ class OpportunitiesClient(BaseGoHighLevelClient):
         """Update opportunity status"""
         await self._request(
             "PUT",
-            f"/opportunities/{opportunity_id}/status",
+            _OPPORTUNITY_PATH + opportunity_id + "/status",
             json={"status": status},  # Note: locationId NOT in body
             location_id=location_id,
         )
@@ -120,5 +131,5 @@ class OpportunitiesClient(BaseGoHighLevelClient):
             params={"locationId": location_id},
             location_id=location_id,
         )
-        data = response.json()
-        return [Pipeline(**p) for p in data.get("pipelines", [])]
\ No newline at end of file
+        data = self._json(response)
+        return _PIPELINE_LIST.validate_python(data.get("pipelines", []))
\ No newline at end of file
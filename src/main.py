@@ -2,14 +2,27 @@
 """GoHighLevel MCP Server using FastMCP"""
 
 import asyncio
+import functools
+import importlib.util
+import inspect
 import sys
-from typing import Optional
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 
+import anyio
+import orjson
+import pydantic_core
 from fastmcp import FastMCP
 
 from .api.client import GoHighLevelClient
+from .models.calendar import Appointment, Calendar
+from .models.contact import Contact
+from .models.conversation import Conversation, Message, MessageList
+from .models.opportunity import Opportunity, Pipeline
 from .services.oauth import OAuthService
 from .services.setup import StandardModeSetup
+from .utils.cache import LONG_TTL, SHORT_TTL, SingleFlight, TTLCache, adaptive_ttl
 from .utils.client_helpers import get_client_with_token_override
 
 # Import parameter classes
@@ -21,111 +34,154 @@ from .mcp.tools.conversations import _register_conversation_tools
 from .mcp.tools.opportunities import _register_opportunity_tools
 from .mcp.tools.calendars import _register_calendar_tools
 from .mcp.tools.forms import _register_form_tools
+from .mcp.tools.batch import _register_batch_tools
+from .mcp.tools.resources import _register_resource_tools, _resource_jobs
+
+
+async def _first_run_custom(setup: StandardModeSetup) -> Union[bool, str]:
+    """First run with custom mode chosen: collect the app credentials"""
+    # Save this choice so a restart continues with custom mode
+    setup.save_custom_mode_choice()
+    custom_setup_success = await setup.interactive_custom_setup()
+    setup.mark_first_run_complete()
+
+    if not custom_setup_success:
+        # User needs to create app first or cancelled
+        # Keep the choice marker so they continue with custom mode on restart
+        return "exit_after_custom_instructions"
+
+    # Credentials collected and .env created, clear the choice marker
+    setup.clear_custom_mode_choice()
+    # Jump directly to Claude Desktop instructions (skip wizard)
+    setup.show_claude_desktop_instructions()
+    return "exit_after_setup"
+
+
+async def _first_run_standard(setup: StandardModeSetup) -> Union[bool, str]:
+    """First run with standard mode chosen: run the setup wizard"""
+    print("📋 Continuing with Standard Mode setup...\n")
+
+    setup_success = await setup.interactive_setup()
+    if not setup_success:
+        print("❌ Setup was not completed successfully.")
+        print("   The MCP server cannot start without valid authentication.")
+        print("   Please run the server again to retry setup.\n")
+        return False
+
+    setup.show_claude_desktop_instructions()
+    return "exit_after_setup"
+
+
+async def _rerun_custom(setup: StandardModeSetup) -> Union[bool, str]:
+    """Existing custom mode setup is invalid: re-run custom setup"""
+    print("🔧 Re-running Custom Mode setup...\n")
+
+    custom_setup_success = await setup.interactive_custom_setup()
+    if not custom_setup_success:
+        print("❌ Custom setup was not completed successfully.")
+        print("   Please run the server again to retry setup.\n")
+        return False
+
+    setup.clear_custom_mode_choice()
+    print("✅ Custom mode setup completed successfully!")
+    setup.show_claude_desktop_instructions()
+    return "exit_after_setup"
+
+
+async def _rerun_standard(setup: StandardModeSetup) -> Union[bool, str]:
+    """Existing standard mode setup is invalid: re-run the setup wizard"""
+    print("🔧 Re-running Standard Mode setup...\n")
+
+    setup_success = await setup.interactive_setup()
+    if not setup_success:
+        print("❌ Setup was not completed successfully.")
+        print("   Please run the server again to retry setup.\n")
+        return False
+
+    print("✅ Standard mode setup completed successfully!")
+    setup.show_claude_desktop_instructions()
+    return "exit_after_setup"
+
+
+# Setup step to run, by (first run, custom mode)
+_SETUP_STEPS: Dict[
+    Tuple[bool, bool],
+    Callable[[StandardModeSetup], Awaitable[Union[bool, str]]],
+] = {
+    (True, True): _first_run_custom,
+    (True, False): _first_run_standard,
+    (False, True): _rerun_custom,
+    (False, False): _rerun_standard,
+}
+
+
+async def _existing_config_valid(setup: StandardModeSetup) -> bool:
+    """Whether the saved authentication is present and accepted by the API"""
+    auth_valid, message = setup.check_auth_status()
+    if not auth_valid:
+        return False
+
+    print(f"✅ {message}")
+    print("🔍 Validating configuration with Basic Machines...")
+    if await setup.validate_existing_config():
+        print("✅ Configuration validated successfully!")
+        return True
+
+    print("⚠️  Configuration validation failed.")
+    print("   Your setup token may have expired or become invalid.")
+    print("🚀 Re-running setup wizard...\n")
+    return False
 
 
 async def startup_check_and_setup():
-    """Check authentication status and run setup if needed"""
+    """Check authentication status and run setup if needed
+
+    Returns True when the server can start, False when setup failed, or
+    "exit_after_setup" / "exit_after_custom_instructions" when the process
+    should exit after setup.
+    """
 
     print("🔧 Basic Machines -> GoHighLevel MCP Server")
     print("   Version 0.1.0")
 
     async with StandardModeSetup() as setup:
-        # Check if this is first run
-        if setup.is_first_run():
+        first_run = setup.is_first_run()
+        if first_run:
             # First run - let user choose mode
-            chosen_mode = setup.choose_auth_mode()
-
-            if chosen_mode == "custom":
-                # Custom mode chosen - save this choice and run interactive setup
-                setup.save_custom_mode_choice()
-                custom_setup_success = await setup.interactive_custom_setup()
-                setup.mark_first_run_complete()
-
-                if custom_setup_success:
-                    # Credentials collected and .env created, clear the choice marker
-                    setup.clear_custom_mode_choice()
-                    # Jump directly to Claude Desktop instructions (skip wizard)
-                    # Continue to show Claude Desktop instructions section
-                else:
-                    # User needs to create app first or cancelled
-                    # Keep the choice marker so they continue with custom mode on restart
-                    return "exit_after_custom_instructions"
-            else:
-                # Standard mode chosen - continue with setup
-                print("📋 Continuing with Standard Mode setup...\n")
-
-                # Standard mode setup wizard
-                setup_success = await setup.interactive_setup()
-
-                if not setup_success:
-                    print("❌ Setup was not completed successfully.")
-                    print(
-                        "   The MCP server cannot start without valid authentication."
-                    )
-                    print("   Please run the server again to retry setup.\n")
-                    return False
-
-                # Standard setup completed successfully, continue to Claude instructions
+            custom_mode = setup.choose_auth_mode() == "custom"
+        elif await _existing_config_valid(setup):
+            return True
         else:
-            # Not first run - check existing auth status
-            auth_valid, message = setup.check_auth_status()
-
-            if auth_valid:
-                # Validate existing config with API
-                print(f"✅ {message}")
-                print("🔍 Validating configuration with Basic Machines...")
-
-                config_valid = await setup.validate_existing_config()
-                if config_valid:
-                    print("✅ Configuration validated successfully!")
-                    return True
-                else:
-                    print("⚠️  Configuration validation failed.")
-                    print("   Your setup token may have expired or become invalid.")
-                    print("🚀 Re-running setup wizard...\n")
-
-            # Run setup wizard based on current mode
-            auth_valid, message = setup.check_auth_status()
-
-            # Check if we're in custom mode (has .env file OR user previously chose custom)
-            if setup.env_file.exists() or setup.was_custom_mode_chosen():
-                # Custom mode - re-run custom setup
-                print("🔧 Re-running Custom Mode setup...\n")
-                custom_setup_success = await setup.interactive_custom_setup()
-
-                if custom_setup_success:
-                    # Custom setup completed successfully
-                    setup.clear_custom_mode_choice()
-                    print("✅ Custom mode setup completed successfully!")
-                    # Show Claude Desktop configuration instructions
-                    setup.show_claude_desktop_instructions()
-                    return "exit_after_setup"
-                else:
-                    print("❌ Custom setup was not completed successfully.")
-                    print("   Please run the server again to retry setup.\n")
-                    return False
-            else:
-                # Standard mode - re-run standard setup
-                print("🔧 Re-running Standard Mode setup...\n")
-                setup_success = await setup.interactive_setup()
-
-                if not setup_success:
-                    print("❌ Setup was not completed successfully.")
-                    print("   Please run the server again to retry setup.\n")
-                    return False
+            # Custom mode has a .env file, or the user previously chose it
+            custom_mode = setup.env_file.exists() or setup.was_custom_mode_chosen()
+
+        return await _SETUP_STEPS[first_run, custom_mode](setup)
 
-                print("✅ Standard mode setup completed successfully!")
-                # Show Claude Desktop configuration instructions
-                setup.show_claude_desktop_instructions()
-                return "exit_after_setup"
 
-        # Show Claude Desktop configuration instructions
-        setup.show_claude_desktop_instructions()
-        return "exit_after_setup"
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a tool result as compact JSON
+
+    FastMCP's default serializer pretty-prints with indent=2; compact output
+    is smaller to send and to read back. Values orjson cannot encode fall
+    back to pydantic's JSON conversion, as do results orjson rejects outright
+    (ints wider than 64 bits); UTC datetimes keep pydantic's "Z" suffix.
+    """
+    try:
+        return orjson.dumps(
+            data,
+            default=_jsonable,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except TypeError:
+        return pydantic_core.to_json(data, fallback=str).decode()
+
+
+def _jsonable(value: Any) -> Any:
+    return pydantic_core.to_jsonable_python(value, fallback=str)
 
 
 # Initialize FastMCP server
-mcp: FastMCP = FastMCP("ghl-mcp-server")
+mcp: FastMCP = FastMCP("ghl-mcp-server", tool_serializer=_serialize_tool_result)
 
 # Global clients - will be initialized after startup check
 oauth_service: Optional[OAuthService] = None
@@ -153,376 +209,448 @@ def register_all_tools():
     _register_opportunity_tools(mcp, get_client, lambda: oauth_service)
     _register_calendar_tools(mcp, get_client)
     _register_form_tools(mcp, get_client)
+    _register_batch_tools(mcp)
+    _register_resource_tools(mcp)
+
+
+def _require_client() -> GoHighLevelClient:
+    """The global GHL client, for resources; fails if it is not set up yet"""
+    if ghl_client is None:
+        raise RuntimeError(
+            "MCP server not properly initialized. Please restart the server."
+        )
+    return ghl_client
 
 
 # Resources will be imported separately in Phase 3
 # For now, they remain in this file to avoid breaking the server
 
+# Rendered resource text, reused briefly for repeated reads of the same URI;
+# slow renders are kept longer, but never past RESOURCE_MAX_TTL seconds
+RESOURCE_CACHE_SIZE = 256
+RESOURCE_MAX_TTL = 15.0
+_resource_cache = TTLCache(RESOURCE_CACHE_SIZE)
+_resource_inflight = SingleFlight()
+
+# Reads still rendering after this many seconds hand back a job ID instead,
+# so a slow upstream does not run into the MCP client's request timeout;
+# the poll_resource_job tool returns the text once the render finishes
+RESOURCE_RENDER_TIMEOUT = 20.0
+
+
+def _pending_resource(job_id: str) -> str:
+    """Text returned for a read that is still rendering, marked as not data"""
+    return (
+        f"PENDING job_id={job_id}\n\n"
+        "This is not the resource content: GoHighLevel is slow to respond and "
+        "the resource is still loading. Call the poll_resource_job tool with "
+        "this job_id to get the result."
+    )
+
+
+def _retrieve_job_error(task: "asyncio.Future[str]") -> None:
+    """Mark a render's error retrieved; the read or poll re-raises it"""
+    if not task.cancelled():
+        task.exception()
+
+
+def _cached_resource(
+    func: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[str]]:
+    """Reuse a resource's text for a short time per set of URI arguments
+
+    Concurrent reads of the same URI share one render. Errors are not cached.
+    Text is kept for SHORT_TTL seconds, up to RESOURCE_MAX_TTL for slow
+    renders. A read that takes over RESOURCE_RENDER_TIMEOUT returns a pending
+    job ID instead; the render carries on and poll_resource_job returns its
+    result.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        key = (func.__name__, *signature.bind(*args, **kwargs).arguments.values())
+        text = _resource_cache.get(key)
+        if text is not None:
+            return text
+
+        async def render() -> str:
+            started = time.monotonic()
+            text = await func(*args, **kwargs)
+            elapsed = time.monotonic() - started
+            ttl = adaptive_ttl(elapsed, SHORT_TTL, RESOURCE_MAX_TTL)
+            _resource_cache.set(key, text, ttl)
+            return text
+
+        # One future serves both this read and, on timeout, the job
+        render_task = asyncio.ensure_future(_resource_inflight.run(key, render))
+        render_task.add_done_callback(_retrieve_job_error)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(render_task), RESOURCE_RENDER_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            job_id = uuid.uuid4().hex
+            _resource_jobs.set(job_id, render_task, LONG_TTL)
+            return _pending_resource(job_id)
+
+    return wrapper
+
+
+def _line(label: str, value: Any) -> str:
+    """An optional "- label: value" line, empty when the value is not set"""
+    return f"\n- {label}: {value}" if value else ""
+
+
+def _contact_name(contact: Contact) -> str:
+    """Display name for a contact in resource text"""
+    return (
+        contact.name
+        or f"{contact.firstName or ''} {contact.lastName or ''}".strip()
+        or "Unknown"
+    )
+
+
+def _format_contact_entry(contact: Contact) -> str:
+    """Format one contact of a contact list resource"""
+    return (
+        f"\n## {_contact_name(contact)}\n"
+        f"- ID: {contact.id}\n"
+        f"- Email: {contact.email or 'N/A'}\n"
+        f"- Phone: {contact.phone or 'N/A'}"
+        f"{_line('Tags', ', '.join(contact.tags or ()))}\n"
+        f"- Date Added: {contact.dateAdded}"
+    )
+
+
+def _format_conversation_entry(conversation: Conversation) -> str:
+    """Format one conversation of a conversation list resource"""
+    return (
+        f"\n## Conversation {conversation.id}\n"
+        f"- Contact ID: {conversation.contactId}\n"
+        f"- Type: {conversation.type}"
+        f"{_line('Last Message Type', conversation.lastMessageType)}"
+        f"{_line('Last Message', conversation.lastMessageDate)}\n"
+        f"- Unread: {'Yes' if conversation.unreadCount > 0 else 'No'}"
+    )
+
+
+def _format_message_entry(message: Message) -> str:
+    """Format one recent message of a conversation resource"""
+    content = f"{message.body[:100]}..." if message.body else None
+    return (
+        f"\n\n### Message {message.id}"
+        f"{_line('Content', content)}\n"
+        f"- Type: {message.type}"
+        f"{_line('Status', message.status)}"
+        f"{_line('Date', message.dateAdded)}"
+    )
+
+
+def _format_opportunity_details(opportunity: Opportunity) -> str:
+    """Format the fields shared by opportunity list and single resources"""
+    value = f"${opportunity.monetaryValue:,.2f}" if opportunity.monetaryValue else None
+    return (
+        f"- ID: {opportunity.id}\n"
+        f"- Contact ID: {opportunity.contactId}\n"
+        f"- Pipeline ID: {opportunity.pipelineId}\n"
+        f"- Stage ID: {opportunity.pipelineStageId}\n"
+        f"- Status: {opportunity.status}"
+        f"{_line('Value', value)}"
+        f"{_line('Assigned To', opportunity.assignedTo)}"
+        f"{_line('Source', opportunity.source)}"
+    )
+
+
+def _format_opportunity_entry(opportunity: Opportunity) -> str:
+    """Format one opportunity of an opportunity list resource"""
+    return (
+        f"\n## {opportunity.name}\n"
+        f"{_format_opportunity_details(opportunity)}\n"
+        f"- Created: {opportunity.createdAt}\n"
+        f"- Updated: {opportunity.updatedAt}"
+    )
+
+
+def _format_pipeline_entry(pipeline: Pipeline, location_id: str) -> str:
+    """Format one pipeline of a pipeline list resource, with its stages"""
+    if pipeline.stages:
+        stages = f"- Stages ({len(pipeline.stages)}):" + "".join(
+            f"\n  - {stage.name} (ID: {stage.id}, Position: {stage.position})"
+            for stage in pipeline.stages
+        )
+    else:
+        stages = "- Stages: None listed"
+    return (
+        f"\n## {pipeline.name}\n"
+        f"- ID: {pipeline.id}\n"
+        f"- Location: {location_id}\n"
+        f"{stages}"
+    )
+
+
+def _format_calendar_details(calendar: Calendar) -> str:
+    """Format the fields shared by calendar list and single resources"""
+    return (
+        f"- ID: {calendar.id}\n"
+        f"- Location: {calendar.locationId}"
+        f"{_line('Description', calendar.description)}"
+        f"{_line('Widget Slug', calendar.widgetSlug)}"
+        f"{_line('Event Title', calendar.eventTitle)}"
+    )
+
+
+def _format_calendar_entry(calendar: Calendar) -> str:
+    """Format one calendar of a calendar list resource"""
+    return f"\n## {calendar.name}\n{_format_calendar_details(calendar)}"
+
+
+def _format_appointment_times(appointment: Appointment) -> str:
+    """Format the optional appointment fields shown by both resources"""
+    return (
+        f"{_line('Start Time', appointment.startTime)}"
+        f"{_line('End Time', appointment.endTime)}"
+        f"{_line('Status', appointment.appointmentStatus)}"
+        f"{_line('Assigned User', appointment.assignedUserId)}"
+        f"{_line('Notes', appointment.notes)}"
+        f"{_line('Address', appointment.address)}"
+    )
+
+
+def _format_appointment_entry(appointment: Appointment) -> str:
+    """Format one appointment of an appointment list resource"""
+    return (
+        f"\n## {appointment.title or 'Untitled Appointment'}\n"
+        f"- ID: {appointment.id}\n"
+        f"- Contact ID: {appointment.contactId}"
+        f"{_format_appointment_times(appointment)}"
+    )
+
 
 @mcp.resource("contacts://{location_id}")
+@_cached_resource
 async def list_contacts_resource(location_id: str) -> str:
     """List all contacts for a location as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    result = await ghl_client.get_contacts(location_id=location_id, limit=100)
+    client = _require_client()
+    result = await client.get_contacts(location_id=location_id, limit=100)
 
     # Format contacts as readable text
-    lines = [f"# Contacts for Location {location_id}\n"]
-    lines.append(f"Total contacts: {result.total or result.count}\n")
-
-    for contact in result.contacts:
-        name = (
-            contact.name
-            or f"{contact.firstName or ''} {contact.lastName or ''}".strip()
-            or "Unknown"
-        )
-        lines.append(f"\n## {name}")
-        lines.append(f"- ID: {contact.id}")
-        lines.append(f"- Email: {contact.email or 'N/A'}")
-        lines.append(f"- Phone: {contact.phone or 'N/A'}")
-        if contact.tags:
-            lines.append(f"- Tags: {', '.join(contact.tags)}")
-        lines.append(f"- Date Added: {contact.dateAdded}")
-
-    return "\n".join(lines)
+    header = (
+        f"# Contacts for Location {location_id}\n\n"
+        f"Total contacts: {result.total or result.count}\n"
+    )
+    return "\n".join([header, *map(_format_contact_entry, result.contacts)])
 
 
 @mcp.resource("contact://{location_id}/{contact_id}")
+@_cached_resource
 async def get_contact_resource(location_id: str, contact_id: str) -> str:
     """Get a single contact as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    contact = await ghl_client.get_contact(contact_id, location_id)
+    client = _require_client()
+    contact = await client.get_contact(contact_id, location_id)
+
+    # Address details are only shown along with a street address
+    address = (
+        f"{_line('Address', contact.address1)}"
+        f"{_line('City', contact.city)}"
+        f"{_line('State', contact.state)}"
+        f"{_line('Postal Code', contact.postalCode)}"
+        if contact.address1
+        else ""
+    )
 
     # Format contact as readable text
-    name = (
-        contact.name
-        or f"{contact.firstName or ''} {contact.lastName or ''}".strip()
-        or "Unknown"
+    return (
+        f"# Contact: {_contact_name(contact)}\n\n"
+        f"- ID: {contact.id}\n"
+        f"- Location: {contact.locationId}\n"
+        f"- Email: {contact.email or 'N/A'}\n"
+        f"- Phone: {contact.phone or 'N/A'}"
+        f"{_line('Tags', ', '.join(contact.tags or ()))}"
+        f"{_line('Source', contact.source)}"
+        f"{_line('Company', contact.companyName)}"
+        f"{address}\n"
+        f"- Date Added: {contact.dateAdded}\n"
+        f"- Last Updated: {contact.dateUpdated}"
     )
-    lines = [f"# Contact: {name}\n"]
-    lines.append(f"- ID: {contact.id}")
-    lines.append(f"- Location: {contact.locationId}")
-    lines.append(f"- Email: {contact.email or 'N/A'}")
-    lines.append(f"- Phone: {contact.phone or 'N/A'}")
-    if contact.tags:
-        lines.append(f"- Tags: {', '.join(contact.tags)}")
-    if contact.source:
-        lines.append(f"- Source: {contact.source}")
-    if contact.companyName:
-        lines.append(f"- Company: {contact.companyName}")
-    if contact.address1:
-        lines.append(f"- Address: {contact.address1}")
-        if contact.city:
-            lines.append(f"- City: {contact.city}")
-        if contact.state:
-            lines.append(f"- State: {contact.state}")
-        if contact.postalCode:
-            lines.append(f"- Postal Code: {contact.postalCode}")
-    lines.append(f"- Date Added: {contact.dateAdded}")
-    lines.append(f"- Last Updated: {contact.dateUpdated}")
-
-    return "\n".join(lines)
 
 
 @mcp.resource("conversations://{location_id}")
+@_cached_resource
 async def list_conversations_resource(location_id: str) -> str:
     """List all conversations for a location as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    result = await ghl_client.get_conversations(location_id=location_id, limit=100)
+    client = _require_client()
+    result = await client.get_conversations(location_id=location_id, limit=100)
 
     # Format conversations as readable text
-    lines = [f"# Conversations for Location {location_id}\n"]
-    lines.append(f"Total conversations: {result.total or result.count}\n")
+    header = (
+        f"# Conversations for Location {location_id}\n\n"
+        f"Total conversations: {result.total or result.count}\n"
+    )
+    return "\n".join([header, *map(_format_conversation_entry, result.conversations)])
 
-    for conversation in result.conversations:
-        lines.append(f"\n## Conversation {conversation.id}")
-        lines.append(f"- Contact ID: {conversation.contactId}")
-        lines.append(f"- Type: {conversation.type}")
-        if conversation.lastMessageType:
-            lines.append(f"- Last Message Type: {conversation.lastMessageType}")
-        if conversation.lastMessageDate:
-            lines.append(f"- Last Message: {conversation.lastMessageDate}")
-        lines.append(f"- Unread: {'Yes' if conversation.unreadCount > 0 else 'No'}")
 
-    return "\n".join(lines)
+async def _get_recent_messages(
+    client: GoHighLevelClient, conversation_id: str, location_id: str
+) -> Optional[MessageList]:
+    """Fetch a conversation's recent messages, or None if they fail to load"""
+    try:
+        return await client.get_messages(
+            conversation_id=conversation_id, location_id=location_id, limit=10
+        )
+    except Exception:
+        return None
 
 
 @mcp.resource("conversation://{location_id}/{conversation_id}")
+@_cached_resource
 async def get_conversation_resource(location_id: str, conversation_id: str) -> str:
     """Get a single conversation as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    conversation = await ghl_client.get_conversation(conversation_id, location_id)
+    client = _require_client()
+    # The conversation and its recent messages are fetched concurrently
+    conversation, messages_result = await asyncio.gather(
+        client.get_conversation(conversation_id, location_id),
+        _get_recent_messages(client, conversation_id, location_id),
+    )
 
-    # Format conversation as readable text
-    lines = [f"# Conversation {conversation.id}\n"]
-    lines.append(f"- Contact ID: {conversation.contactId}")
-    lines.append(f"- Type: {conversation.type}")
-    if conversation.lastMessageType:
-        lines.append(f"- Last Message Type: {conversation.lastMessageType}")
-    if conversation.lastMessageDate:
-        lines.append(f"- Last Message: {conversation.lastMessageDate}")
-    lines.append(f"- Unread: {'Yes' if conversation.unreadCount > 0 else 'No'}")
-
-    # Get recent messages
-    try:
-        messages_result = await ghl_client.get_messages(
-            conversation_id=conversation_id, location_id=location_id, limit=10
+    # Show recent messages
+    if messages_result is None:
+        messages = "\n\n## Recent Messages: Unable to load"
+    elif messages_result.messages:
+        messages = f"\n\n## Recent Messages ({len(messages_result.messages)})" + (
+            # Show last 5 messages
+            "".join(map(_format_message_entry, messages_result.messages[-5:]))
         )
-        if messages_result.messages:
-            lines.append(f"\n## Recent Messages ({len(messages_result.messages)})")
-            for msg in messages_result.messages[-5:]:  # Show last 5 messages
-                lines.append(f"\n### Message {msg.id}")
-                if msg.body:
-                    lines.append(f"- Content: {msg.body[:100]}...")
-                lines.append(f"- Type: {msg.type}")
-                if msg.status:
-                    lines.append(f"- Status: {msg.status}")
-                if msg.dateAdded:
-                    lines.append(f"- Date: {msg.dateAdded}")
-    except Exception:
-        lines.append("\n## Recent Messages: Unable to load")
+    else:
+        messages = ""
 
-    return "\n".join(lines)
+    # Format conversation as readable text
+    return (
+        f"# Conversation {conversation.id}\n\n"
+        f"- Contact ID: {conversation.contactId}\n"
+        f"- Type: {conversation.type}"
+        f"{_line('Last Message Type', conversation.lastMessageType)}"
+        f"{_line('Last Message', conversation.lastMessageDate)}\n"
+        f"- Unread: {'Yes' if conversation.unreadCount > 0 else 'No'}"
+        f"{messages}"
+    )
 
 
 @mcp.resource("opportunities://{location_id}")
+@_cached_resource
 async def list_opportunities_resource(location_id: str) -> str:
     """List all opportunities for a location as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    from .models.opportunity import OpportunitySearchFilters
-
+    client = _require_client()
     # Get opportunities with no filters (all opportunities)
-    result = await ghl_client.get_opportunities(
-        location_id=location_id,
-        limit=100,
-        skip=0,
-        filters=OpportunitySearchFilters(
-            pipelineId=None,
-            pipelineStageId=None,
-            assignedTo=None,
-            status=None,
-            contactId=None,
-            startDate=None,
-            endDate=None,
-            query=None,
-        ),
-    )
+    result = await client.get_opportunities(location_id=location_id, limit=100, skip=0)
 
     # Format opportunities as readable text
-    lines = [f"# Opportunities for Location {location_id}\n"]
-    lines.append(f"Total opportunities: {result.total or result.count}\n")
-
-    for opportunity in result.opportunities:
-        lines.append(f"\n## {opportunity.name}")
-        lines.append(f"- ID: {opportunity.id}")
-        lines.append(f"- Contact ID: {opportunity.contactId}")
-        lines.append(f"- Pipeline ID: {opportunity.pipelineId}")
-        lines.append(f"- Stage ID: {opportunity.pipelineStageId}")
-        lines.append(f"- Status: {opportunity.status}")
-        if opportunity.monetaryValue:
-            lines.append(f"- Value: ${opportunity.monetaryValue:,.2f}")
-        if opportunity.assignedTo:
-            lines.append(f"- Assigned To: {opportunity.assignedTo}")
-        if opportunity.source:
-            lines.append(f"- Source: {opportunity.source}")
-        lines.append(f"- Created: {opportunity.createdAt}")
-        lines.append(f"- Updated: {opportunity.updatedAt}")
-
-    return "\n".join(lines)
+    header = (
+        f"# Opportunities for Location {location_id}\n\n"
+        f"Total opportunities: {result.total or result.count}\n"
+    )
+    return "\n".join([header, *map(_format_opportunity_entry, result.opportunities)])
 
 
 @mcp.resource("opportunity://{location_id}/{opportunity_id}")
+@_cached_resource
 async def get_opportunity_resource(location_id: str, opportunity_id: str) -> str:
     """Get a single opportunity as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    opportunity = await ghl_client.get_opportunity(opportunity_id, location_id)
+    client = _require_client()
+    opportunity = await client.get_opportunity(opportunity_id, location_id)
 
     # Format opportunity as readable text
-    lines = [f"# Opportunity: {opportunity.name}\n"]
-    lines.append(f"- ID: {opportunity.id}")
-    lines.append(f"- Contact ID: {opportunity.contactId}")
-    lines.append(f"- Pipeline ID: {opportunity.pipelineId}")
-    lines.append(f"- Stage ID: {opportunity.pipelineStageId}")
-    lines.append(f"- Status: {opportunity.status}")
-    if opportunity.monetaryValue:
-        lines.append(f"- Value: ${opportunity.monetaryValue:,.2f}")
-    if opportunity.assignedTo:
-        lines.append(f"- Assigned To: {opportunity.assignedTo}")
-    if opportunity.source:
-        lines.append(f"- Source: {opportunity.source}")
-    if opportunity.notes:
-        lines.append(f"- Notes: {opportunity.notes}")
-    lines.append(f"- Created: {opportunity.createdAt}")
-    lines.append(f"- Updated: {opportunity.updatedAt}")
-    if opportunity.lastStatusChangeAt:
-        lines.append(f"- Last Status Change: {opportunity.lastStatusChangeAt}")
-    if opportunity.lastStageChangeAt:
-        lines.append(f"- Last Stage Change: {opportunity.lastStageChangeAt}")
-
-    return "\n".join(lines)
+    return (
+        f"# Opportunity: {opportunity.name}\n\n"
+        f"{_format_opportunity_details(opportunity)}"
+        f"{_line('Notes', opportunity.notes)}\n"
+        f"- Created: {opportunity.createdAt}\n"
+        f"- Updated: {opportunity.updatedAt}"
+        f"{_line('Last Status Change', opportunity.lastStatusChangeAt)}"
+        f"{_line('Last Stage Change', opportunity.lastStageChangeAt)}"
+    )
 
 
 @mcp.resource("pipelines://{location_id}")
+@_cached_resource
 async def list_pipelines_resource(location_id: str) -> str:
     """List all pipelines for a location as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    pipelines = await ghl_client.get_pipelines(location_id)
+    client = _require_client()
+    pipelines = await client.get_pipelines(location_id)
 
     # Format pipelines as readable text
-    lines = [f"# Pipelines for Location {location_id}\n"]
-    lines.append(f"Total pipelines: {len(pipelines)}\n")
-
-    for pipeline in pipelines:
-        lines.append(f"\n## {pipeline.name}")
-        lines.append(f"- ID: {pipeline.id}")
-        lines.append(f"- Location: {location_id}")
-
-        # Show stages if available
-        if pipeline.stages:
-            lines.append(f"- Stages ({len(pipeline.stages)}):")
-            for stage in pipeline.stages:
-                lines.append(
-                    f"  - {stage.name} (ID: {stage.id}, Position: {stage.position})"
-                )
-        else:
-            lines.append("- Stages: None listed")
-
-    return "\n".join(lines)
+    header = (
+        f"# Pipelines for Location {location_id}\n\n"
+        f"Total pipelines: {len(pipelines)}\n"
+    )
+    return "\n".join(
+        [header, *(_format_pipeline_entry(p, location_id) for p in pipelines)]
+    )
 
 
 @mcp.resource("calendars://{location_id}")
+@_cached_resource
 async def list_calendars_resource(location_id: str) -> str:
     """List all calendars for a location as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    result = await ghl_client.get_calendars(location_id)
+    client = _require_client()
+    result = await client.get_calendars(location_id)
 
     # Format calendars as readable text
-    lines = [f"# Calendars for Location {location_id}\n"]
-    lines.append(f"Total calendars: {result.count}\n")
-
-    for calendar in result.calendars:
-        lines.append(f"\n## {calendar.name}")
-        lines.append(f"- ID: {calendar.id}")
-        lines.append(f"- Location: {calendar.locationId}")
-        if calendar.description:
-            lines.append(f"- Description: {calendar.description}")
-        if calendar.widgetSlug:
-            lines.append(f"- Widget Slug: {calendar.widgetSlug}")
-        if calendar.eventTitle:
-            lines.append(f"- Event Title: {calendar.eventTitle}")
-
-    return "\n".join(lines)
+    header = (
+        f"# Calendars for Location {location_id}\n\n"
+        f"Total calendars: {result.count}\n"
+    )
+    return "\n".join([header, *map(_format_calendar_entry, result.calendars)])
 
 
 @mcp.resource("calendar://{location_id}/{calendar_id}")
+@_cached_resource
 async def get_calendar_resource(location_id: str, calendar_id: str) -> str:
     """Get a single calendar as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    calendar = await ghl_client.get_calendar(calendar_id, location_id)
+    client = _require_client()
+    calendar = await client.get_calendar(calendar_id, location_id)
 
     # Format calendar as readable text
-    lines = [f"# Calendar: {calendar.name}\n"]
-    lines.append(f"- ID: {calendar.id}")
-    lines.append(f"- Location: {calendar.locationId}")
-    if calendar.description:
-        lines.append(f"- Description: {calendar.description}")
-    if calendar.widgetSlug:
-        lines.append(f"- Widget Slug: {calendar.widgetSlug}")
-    if calendar.eventTitle:
-        lines.append(f"- Event Title: {calendar.eventTitle}")
-
-    return "\n".join(lines)
+    return f"# Calendar: {calendar.name}\n\n{_format_calendar_details(calendar)}"
 
 
 @mcp.resource("appointments://{location_id}/{contact_id}")
+@_cached_resource
 async def list_appointments_resource(location_id: str, contact_id: str) -> str:
     """List all appointments for a contact as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    result = await ghl_client.get_appointments(
+    client = _require_client()
+    result = await client.get_appointments(
         contact_id=contact_id, location_id=location_id
     )
 
     # Format appointments as readable text
-    lines = [f"# Appointments for Contact {contact_id}\n"]
-    lines.append(f"Total appointments: {result.count}\n")
-
-    for appointment in result.appointments:
-        lines.append(f"\n## {appointment.title or 'Untitled Appointment'}")
-        lines.append(f"- ID: {appointment.id}")
-        lines.append(f"- Contact ID: {appointment.contactId}")
-        if appointment.startTime:
-            lines.append(f"- Start Time: {appointment.startTime}")
-        if appointment.endTime:
-            lines.append(f"- End Time: {appointment.endTime}")
-        if appointment.appointmentStatus:
-            lines.append(f"- Status: {appointment.appointmentStatus}")
-        if appointment.assignedUserId:
-            lines.append(f"- Assigned User: {appointment.assignedUserId}")
-        if appointment.notes:
-            lines.append(f"- Notes: {appointment.notes}")
-        if appointment.address:
-            lines.append(f"- Address: {appointment.address}")
-
-    return "\n".join(lines)
+    header = (
+        f"# Appointments for Contact {contact_id}\n\n"
+        f"Total appointments: {result.count}\n"
+    )
+    return "\n".join([header, *map(_format_appointment_entry, result.appointments)])
 
 
 @mcp.resource("appointment://{location_id}/{appointment_id}")
+@_cached_resource
 async def get_appointment_resource(location_id: str, appointment_id: str) -> str:
     """Get a single appointment as a resource"""
-    if ghl_client is None:
-        raise RuntimeError(
-            "MCP server not properly initialized. Please restart the server."
-        )
-    appointment = await ghl_client.get_appointment(appointment_id, location_id)
+    client = _require_client()
+    appointment = await client.get_appointment(appointment_id, location_id)
 
     # Format appointment as readable text
-    lines = [f"# Appointment: {appointment.title or 'Untitled'}\n"]
-    lines.append(f"- ID: {appointment.id}")
-    lines.append(f"- Calendar ID: {appointment.calendarId}")
-    lines.append(f"- Contact ID: {appointment.contactId}")
-    if appointment.startTime:
-        lines.append(f"- Start Time: {appointment.startTime}")
-    if appointment.endTime:
-        lines.append(f"- End Time: {appointment.endTime}")
-    if appointment.appointmentStatus:
-        lines.append(f"- Status: {appointment.appointmentStatus}")
-    if appointment.assignedUserId:
-        lines.append(f"- Assigned User: {appointment.assignedUserId}")
-    if appointment.notes:
-        lines.append(f"- Notes: {appointment.notes}")
-    if appointment.address:
-        lines.append(f"- Address: {appointment.address}")
-
-    return "\n".join(lines)
+    return (
+        f"# Appointment: {appointment.title or 'Untitled'}\n\n"
+        f"- ID: {appointment.id}\n"
+        f"- Calendar ID: {appointment.calendarId}\n"
+        f"- Contact ID: {appointment.contactId}"
+        f"{_format_appointment_times(appointment)}"
+    )
+
+
+def _use_uvloop() -> bool:
+    """Whether the server can run on uvloop instead of the default event loop"""
+    return sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
 
 
 def main():
@@ -576,8 +704,11 @@ def main():
         print("   Ready to receive requests from your LLM!")
         print("   Press Ctrl+C to stop the server.\n")
 
-    # Start the FastMCP server using its built-in run method
-    mcp.run()
+    # Start the FastMCP server, on uvloop where it is installed
+    anyio.run(
+        mcp.run_async,
+        backend_options={"use_uvloop": _use_uvloop()},
+    )
 
 
 # Run the server
@@ -0,0 +1,29 @@
+"""Parameter models for the batch MCP tool"""
+
+from typing import Any, Dict, List
+from pydantic import BaseModel, Field
+
+
+class BatchCall(BaseModel):
+    """A single tool call inside a batch"""
+
+    tool: str = Field(..., description="Name of the tool to call, e.g. create_contact")
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description='Arguments for the tool, as for a direct call: {"params": {...}}',
+    )
+
+
+class BatchExecuteParams(BaseModel):
+    """Parameters for running several tool calls at once"""
+
+    calls: List[BatchCall] = Field(
+        ..., min_length=1, description="Tool calls to run; results keep this order"
+    )
+    max_concurrent: int = Field(
+        default=10, ge=1, le=32, description="Maximum number of calls run at once"
+    )
+    stop_on_error: bool = Field(
+        default=False,
+        description="Skip calls that have not started once any call fails",
+    )
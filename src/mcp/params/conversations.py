@@ -3,7 +3,7 @@
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 
-from ...models.conversation import MessageStatus
+from ...models.conversation import MessageStatus, MessageType
 
 
 class GetConversationsParams(BaseModel):
@@ -37,7 +37,7 @@ class CreateConversationParams(BaseModel):
 
     location_id: str = Field(..., description="The location ID")
     contact_id: str = Field(..., description="The contact ID")
-    message_type: Optional[str] = Field(
+    message_type: Optional[MessageType] = Field(
         None,
         description="Initial message type: SMS, Email, WhatsApp, IG, FB, Custom, Live_Chat",
     )
@@ -0,0 +1,9 @@
+"""Parameter models for MCP resource helper tools"""
+
+from pydantic import BaseModel, Field
+
+
+class PollResourceJobParams(BaseModel):
+    """Parameters for polling a slow resource read"""
+
+    job_id: str = Field(..., description="Job ID returned by the pending resource")
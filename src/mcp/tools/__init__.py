@@ -5,4 +5,6 @@ from .contacts import *  # noqa: F403
 from .conversations import *  # noqa: F403
 from .opportunities import *  # noqa: F403
 from .calendars import *  # noqa: F403
-from .forms import *  # noqa: F403
\ No newline at end of file
+from .forms import *  # noqa: F403
+from .batch import *  # noqa: F403
+from .resources import *  # noqa: F403
@@ -0,0 +1,70 @@
+"""Batch tool for running several GoHighLevel MCP tools in one call"""
+
+import asyncio
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+from pydantic import TypeAdapter
+
+from ..params.batch import BatchCall, BatchExecuteParams
+
+
+# Import the mcp instance from main
+# This will be set during import in main.py
+mcp = None
+
+
+@lru_cache(maxsize=None)
+def _call_adapter(fn: Callable[..., Any]) -> TypeAdapter:
+    """Validate a tool's arguments and call it, the way FastMCP does"""
+    return TypeAdapter(fn)
+
+
+def _register_batch_tools(_mcp):
+    """Register the batch tool with the MCP instance"""
+    global mcp
+    mcp = _mcp
+
+    @mcp.tool()
+    async def batch_execute(params: BatchExecuteParams) -> Dict[str, Any]:
+        """Run several tool calls concurrently and return all their results
+
+        Each call names a tool and passes the same arguments as a direct call.
+        Results come back in call order; a failed call reports its error
+        without affecting the others, unless stop_on_error is set.
+        """
+        tools = await mcp.get_tools()
+        semaphore = asyncio.Semaphore(params.max_concurrent)
+        failed = asyncio.Event()
+
+        async def run(call: BatchCall) -> Dict[str, Any]:
+            tool = tools.get(call.tool)
+            if tool is None or call.tool == "batch_execute":
+                return {
+                    "tool": call.tool,
+                    "success": False,
+                    "error": f"Unknown tool: {call.tool}",
+                }
+            async with semaphore:
+                if failed.is_set():
+                    return {
+                        "tool": call.tool,
+                        "success": False,
+                        "error": "Skipped after an earlier call failed",
+                    }
+                try:
+                    result = _call_adapter(tool.fn).validate_python(call.arguments)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    if params.stop_on_error:
+                        failed.set()
+                    return {"tool": call.tool, "success": False, "error": str(e)}
+            return {"tool": call.tool, "success": True, "result": result}
+
+        results = await asyncio.gather(*(run(call) for call in params.calls))
+        return {
+            "success": all(result["success"] for result in results),
+            "results": results,
+        }
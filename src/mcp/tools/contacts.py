@@ -1,8 +1,10 @@
 """Contact tools for GoHighLevel MCP integration"""
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
 
-from ...models.contact import ContactCreate, ContactUpdate
+from pydantic import TypeAdapter
+
+from ...models.contact import Contact, ContactCreate, ContactUpdate
 from ..params.contacts import (
     CreateContactParams,
     UpdateContactParams,
@@ -12,6 +14,18 @@ from ..params.contacts import (
     ManageTagsParams,
 )
 
+# Serializer bound once, instead of going through model_dump() per contact
+_dump_contact = Contact.__pydantic_serializer__.to_python
+# Serializes a whole result list in one call
+_dump_contacts = TypeAdapter(List[Contact]).dump_python
+
+
+def _custom_fields(values: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Convert tool custom field values to the API's key/value list, if any"""
+    if not values:
+        return None
+    return [{"key": key, "value": value} for key, value in values.items()]
+
 
 # Import the mcp instance and get_client from main
 # This will be set during import in main.py
@@ -30,7 +44,8 @@ def _register_contact_tools(_mcp, _get_client):
         """Create a new contact in GoHighLevel"""
         client = await get_client(params.access_token)
 
-        contact_data = ContactCreate(
+        # params is already validated, and its field types match the model's
+        contact_data = ContactCreate.model_construct(
             locationId=params.location_id,
             firstName=params.first_name,
             lastName=params.last_name,
@@ -43,20 +58,18 @@ def _register_contact_tools(_mcp, _get_client):
             city=params.city,
             state=params.state,
             postalCode=params.postal_code,
-            customFields=[
-                {"key": k, "value": v} for k, v in (params.custom_fields or {}).items()
-            ],
+            customFields=_custom_fields(params.custom_fields),
         )
 
         contact = await client.create_contact(contact_data)
-        return {"success": True, "contact": contact.model_dump()}
+        return {"success": True, "contact": _dump_contact(contact)}
 
     @mcp.tool()
     async def update_contact(params: UpdateContactParams) -> Dict[str, Any]:
         """Update an existing contact in GoHighLevel"""
         client = await get_client(params.access_token)
 
-        update_data = ContactUpdate(
+        update_data = ContactUpdate.model_construct(
             firstName=params.first_name,
             lastName=params.last_name,
             email=params.email,
@@ -67,20 +80,13 @@ def _register_contact_tools(_mcp, _get_client):
             city=params.city,
             state=params.state,
             postalCode=params.postal_code,
-            customFields=(
-                [
-                    {"key": k, "value": v}
-                    for k, v in (params.custom_fields or {}).items()
-                ]
-                if params.custom_fields
-                else None
-            ),
+            customFields=_custom_fields(params.custom_fields),
         )
 
         contact = await client.update_contact(
             params.contact_id, update_data, params.location_id
         )
-        return {"success": True, "contact": contact.model_dump()}
+        return {"success": True, "contact": _dump_contact(contact)}
 
     @mcp.tool()
     async def delete_contact(params: DeleteContactParams) -> Dict[str, Any]:
@@ -103,7 +109,7 @@ def _register_contact_tools(_mcp, _get_client):
         client = await get_client(params.access_token)
 
         contact = await client.get_contact(params.contact_id, params.location_id)
-        return {"success": True, "contact": contact.model_dump()}
+        return {"success": True, "contact": _dump_contact(contact)}
 
     @mcp.tool()
     async def search_contacts(params: SearchContactsParams) -> Dict[str, Any]:
@@ -122,7 +128,7 @@ def _register_contact_tools(_mcp, _get_client):
 
         return {
             "success": True,
-            "contacts": [c.model_dump() for c in result.contacts],
+            "contacts": _dump_contacts(result.contacts),
             "count": result.count,
             "total": result.total,
         }
@@ -135,7 +141,7 @@ def _register_contact_tools(_mcp, _get_client):
         contact = await client.add_contact_tags(
             params.contact_id, params.tags, params.location_id
         )
-        return {"success": True, "contact": contact.model_dump()}
+        return {"success": True, "contact": _dump_contact(contact)}
 
     @mcp.tool()
     async def remove_contact_tags(params: ManageTagsParams) -> Dict[str, Any]:
@@ -145,4 +151,4 @@ def _register_contact_tools(_mcp, _get_client):
         contact = await client.remove_contact_tags(
             params.contact_id, params.tags, params.location_id
         )
-        return {"success": True, "contact": contact.model_dump()}
\ No newline at end of file
+        return {"success": True, "contact": _dump_contact(contact)}
\ No newline at end of file
@@ -1,8 +1,15 @@
 """Conversation tools for GoHighLevel MCP integration"""
 
-from typing import Dict, Any
+from typing import Any, Dict, List
 
-from ...models.conversation import ConversationCreate, MessageCreate, MessageType
+from pydantic import TypeAdapter
+
+from ...models.conversation import (
+    Conversation,
+    ConversationCreate,
+    Message,
+    MessageCreate,
+)
 from ..params.conversations import (
     GetConversationsParams,
     GetConversationParams,
@@ -12,6 +19,12 @@ from ..params.conversations import (
     UpdateMessageStatusParams,
 )
 
+# Bound serializers with the same output as model_dump(); lists go in one call
+_dump_conversation = Conversation.__pydantic_serializer__.to_python
+_dump_message = Message.__pydantic_serializer__.to_python
+_dump_conversations = TypeAdapter(List[Conversation]).dump_python
+_dump_messages = TypeAdapter(List[Message]).dump_python
+
 
 # Import the mcp instance and get_client from main
 # This will be set during import in main.py
@@ -41,7 +54,7 @@ def _register_conversation_tools(_mcp, _get_client):
 
         return {
             "success": True,
-            "conversations": [c.model_dump() for c in result.conversations],
+            "conversations": _dump_conversations(result.conversations),
             "count": result.count,
             "total": result.total,
         }
@@ -54,23 +67,22 @@ def _register_conversation_tools(_mcp, _get_client):
         conversation = await client.get_conversation(
             params.conversation_id, params.location_id
         )
-        return {"success": True, "conversation": conversation.model_dump()}
+        return {"success": True, "conversation": _dump_conversation(conversation)}
 
     @mcp.tool()
     async def create_conversation(params: CreateConversationParams) -> Dict[str, Any]:
         """Create a new conversation"""
         client = await get_client(params.access_token)
 
-        conversation_data = ConversationCreate(
+        # Skip re-validating fields params already validated, message type included
+        conversation_data = ConversationCreate.model_construct(
             locationId=params.location_id,
             contactId=params.contact_id,
-            lastMessageType=(
-                MessageType(params.message_type) if params.message_type else None
-            ),
+            lastMessageType=params.message_type,
         )
 
         conversation = await client.create_conversation(conversation_data)
-        return {"success": True, "conversation": conversation.model_dump()}
+        return {"success": True, "conversation": _dump_conversation(conversation)}
 
     @mcp.tool()
     async def get_messages(params: GetMessagesParams) -> Dict[str, Any]:
@@ -86,7 +98,7 @@ def _register_conversation_tools(_mcp, _get_client):
 
         return {
             "success": True,
-            "messages": [m.model_dump() for m in result.messages],
+            "messages": _dump_messages(result.messages),
             "count": result.count,
             "total": result.total,
         }
@@ -96,7 +108,8 @@ def _register_conversation_tools(_mcp, _get_client):
         """Send a message in a conversation"""
         client = await get_client(params.access_token)
 
-        message_data = MessageCreate(
+        # Built without validation; every value comes from validated params
+        message_data = MessageCreate.model_construct(
             type=params.message_type,
             contactId=params.contact_id,
             message=params.message,
@@ -113,7 +126,7 @@ def _register_conversation_tools(_mcp, _get_client):
             location_id=params.location_id,
         )
 
-        return {"success": True, "message": message.model_dump()}
+        return {"success": True, "message": _dump_message(message)}
 
     @mcp.tool()
     async def update_message_status(
@@ -0,0 +1,37 @@
+"""Resource helper tools for GoHighLevel MCP integration"""
+
+from typing import Any, Dict
+
+from ...utils.cache import TTLCache
+from ..params.resources import PollResourceJobParams
+
+# Resource reads that outlived the render timeout in main._cached_resource:
+# job ID -> task finishing the render, dropped once its result is fetched
+RESOURCE_JOB_CACHE_SIZE = 256
+_resource_jobs = TTLCache(RESOURCE_JOB_CACHE_SIZE)
+
+
+# Import the mcp instance from main
+# This will be set during import in main.py
+mcp = None
+
+
+def _register_resource_tools(_mcp):
+    """Register resource helper tools with the MCP instance"""
+    global mcp
+    mcp = _mcp
+
+    @mcp.tool()
+    async def poll_resource_job(params: PollResourceJobParams) -> Dict[str, Any]:
+        """Get the result of a resource read that returned a pending job ID"""
+        job = _resource_jobs.get(params.job_id)
+        if job is None:
+            return {
+                "success": False,
+                "message": "Unknown or expired job ID; read the resource again",
+            }
+        if not job.done():
+            return {"success": True, "status": "pending", "job_id": params.job_id}
+
+        _resource_jobs.pop(params.job_id)
+        return {"success": True, "status": "done", "content": job.result()}
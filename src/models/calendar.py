@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List, Union, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from enum import Enum
 
 
@@ -34,7 +34,29 @@ class CalendarType(str, Enum):
     COLLECTIVE = "collective"
 
 
-class AppointmentCreate(BaseModel):
+class _AppointmentTimesModel(BaseModel):
+    """Shared startTime/endTime parsing and serialization for appointment writes"""
+
+    @field_validator("startTime", "endTime", mode="before", check_fields=False)
+    @classmethod
+    def parse_datetime(cls, v):
+        """Parse datetime from string or return as-is if already datetime"""
+        if isinstance(v, str):
+            try:
+                if v.endswith("Z"):
+                    return datetime.fromisoformat(v.replace("Z", "+00:00"))
+                return datetime.fromisoformat(v)
+            except (ValueError, TypeError):
+                return None
+        return v
+
+    @field_serializer("startTime", "endTime", check_fields=False)
+    def serialize_datetime(self, v):
+        """Serialize datetimes to ISO strings for the API"""
+        return v.isoformat() if isinstance(v, datetime) else v
+
+
+class AppointmentCreate(_AppointmentTimesModel):
     """Model for creating an appointment"""
 
     calendarId: str = Field(
@@ -69,26 +91,8 @@ class AppointmentCreate(BaseModel):
     )
     toNotify: Optional[bool] = Field(None, description="Send notifications")
 
-    @field_validator("startTime", "endTime", mode="before")
-    @classmethod
-    def parse_datetime(cls, v):
-        """Parse datetime from string or return as-is if already datetime"""
-        if isinstance(v, str):
-            from datetime import datetime
-
-            try:
-                if v.endswith("Z"):
-                    return datetime.fromisoformat(v.replace("Z", "+00:00"))
-                elif "T" in v:
-                    return datetime.fromisoformat(v)
-                else:
-                    return datetime.fromisoformat(v)
-            except (ValueError, TypeError):
-                return None
-        return v
-
 
-class AppointmentUpdate(BaseModel):
+class AppointmentUpdate(_AppointmentTimesModel):
     """Model for updating an appointment"""
 
     startTime: Optional[Union[datetime, str]] = Field(
@@ -111,24 +115,6 @@ class AppointmentUpdate(BaseModel):
     address: Optional[str] = Field(None, description="Physical meeting address")
     toNotify: Optional[bool] = Field(None, description="Send notifications")
 
-    @field_validator("startTime", "endTime", mode="before")
-    @classmethod
-    def parse_datetime(cls, v):
-        """Parse datetime from string or return as-is if already datetime"""
-        if isinstance(v, str):
-            from datetime import datetime
-
-            try:
-                if v.endswith("Z"):
-                    return datetime.fromisoformat(v.replace("Z", "+00:00"))
-                elif "T" in v:
-                    return datetime.fromisoformat(v)
-                else:
-                    return datetime.fromisoformat(v)
-            except (ValueError, TypeError):
-                return None
-        return v
-
 
 class Appointment(BaseModel):
     """Complete appointment model from API response"""
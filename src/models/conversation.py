@@ -104,7 +104,12 @@ class MessageCreate(BaseModel):
 
     # SMS fields
     message: Optional[str] = Field(None, description="Message content for SMS")
-    phone: Optional[str] = Field(None, description="Phone number for SMS messages")
+    # The send endpoint expects the number as phoneNumber
+    phone: Optional[str] = Field(
+        None,
+        serialization_alias="phoneNumber",
+        description="Phone number for SMS messages",
+    )
 
     # Email fields
     html: Optional[str] = Field(None, description="HTML content for email messages")
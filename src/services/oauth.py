@@ -14,6 +14,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 from ..models.auth import TokenResponse, StoredToken
+from ..utils.cache import SingleFlight
 
 
 class AuthMode(str, Enum):
@@ -84,6 +85,8 @@ class StandardAuthService:
         self.client = httpx.AsyncClient()
         self._company_token_cache: Optional[Dict] = None
         self._location_token_cache: Dict[str, Dict] = {}
+        # Token fetches in progress, shared by concurrent callers
+        self._inflight = SingleFlight()
         self._load_setup_token()
 
     def _load_setup_token(self):
@@ -117,6 +120,9 @@ class StandardAuthService:
             if expires_at > datetime.now():
                 return self._company_token_cache["access_token"]
 
+        return await self._inflight.run("company_token", self._fetch_company_token)
+
+    async def _fetch_company_token(self) -> str:
         # Fetch from Supabase (any location_id works since we want the company token)
         response = await self.client.post(
             f"{self.settings.supabase_url}/functions/v1/get-token",
@@ -194,6 +200,12 @@ class StandardAuthService:
             if expires_at > datetime.now():
                 return cached["access_token"]
 
+        return await self._inflight.run(
+            ("location_token", location_id),
+            lambda: self._fetch_location_token(location_id),
+        )
+
+    async def _fetch_location_token(self, location_id: str) -> str:
         # Get company token first
         company_token = await self.get_company_token()
 
@@ -269,6 +281,8 @@ class OAuthService:
         self._auth_code_future: Optional[asyncio.Future[str]] = None
         self._location_tokens: Dict[str, StoredToken] = {}  # Cache for location tokens
         self._standard_auth: Optional[StandardAuthService] = None  # Initialize as None
+        # Token loads and refreshes in progress, shared by concurrent callers
+        self._inflight = SingleFlight()
 
         # Debug environment and settings
         from pathlib import Path
@@ -354,13 +368,20 @@ class OAuthService:
             return await self.get_valid_token()
 
     async def get_valid_token(self) -> str:
-        """Get a valid access token, refreshing if necessary"""
+        """Get a valid access token, refreshing if necessary
+
+        Concurrent callers share one load, so an expiring token is refreshed
+        once instead of once per caller.
+        """
         if self.settings.auth_mode == AuthMode.STANDARD:
             raise Exception(
                 "In standard mode, use get_company_token or get_location_token. "
                 "Agency tokens are managed by the proxy."
             )
 
+        return await self._inflight.run("agency_token", self._load_valid_token)
+
+    async def _load_valid_token(self) -> str:
         token = await self.load_token()
 
         if not token:
@@ -548,6 +569,12 @@ class OAuthService:
             if not cached_token.needs_refresh():
                 return cached_token.access_token
 
+        return await self._inflight.run(
+            ("location_token", location_id),
+            lambda: self._fetch_location_token(location_id),
+        )
+
+    async def _fetch_location_token(self, location_id: str) -> str:
         # Get agency token
         agency_token = await self.get_valid_token()
 
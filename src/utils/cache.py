@@ -0,0 +1,206 @@
+"""In-process TTL cache and request coalescing for idempotent API reads"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Cache lifetimes in seconds, by how often the underlying data changes
+SHORT_TTL = 10.0
+NORMAL_TTL = 30.0
+LONG_TTL = 300.0
+
+# How long an expired entry is kept as a fallback for failed refreshes
+STALE_TTL = 3600.0
+
+# Adaptive TTLs grow with how long the upstream took to produce the value
+ADAPTIVE_TTL_FACTOR = 10.0
+ADAPTIVE_TTL_BUFFER = 2.0
+
+_MISS = object()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after a per-entry TTL
+
+    Entries can be kept for an extra stale_ttl past expiry; ``get`` no longer
+    returns them, but ``get_stale`` does. The least recently used entry is
+    evicted once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        # key -> (fresh until, kept until, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        return self._lookup(key, default, stale=False)
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key even if expired, while it is kept"""
+        return self._lookup(key, default, stale=True)
+
+    def _lookup(self, key: Hashable, default: Any, stale: bool) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        fresh_until, kept_until, value = entry
+        now = time.monotonic()
+        if now >= kept_until:
+            del self._entries[key]
+            return default
+        if now >= fresh_until and not stale:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0.0
+    ) -> None:
+        """Store value under key for ttl seconds, kept stale_ttl longer"""
+        fresh_until = time.monotonic() + ttl
+        self._entries[key] = (fresh_until, fresh_until + stale_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value, even if expired, or default"""
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[2]
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight call"""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await factory(), or the call already in flight for key"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        # Shielded so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled
+            task.exception()
+
+
+def adaptive_ttl(elapsed: float, min_ttl: float, max_ttl: float) -> float:
+    """TTL for a value that took elapsed seconds to fetch, within bounds
+
+    Expensive responses are kept longer, since refetching them costs as much.
+    """
+    ttl = elapsed * ADAPTIVE_TTL_FACTOR + ADAPTIVE_TTL_BUFFER
+    return min(max(ttl, min_ttl), max_ttl)
+
+
+def _call_key(
+    func: Callable[..., Any], signature: inspect.Signature, args: Any, kwargs: Any
+) -> Tuple[Any, ...]:
+    """Key a method call by name and bound arguments, excluding self"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return (func.__name__, *tuple(bound.arguments.values())[1:])
+
+
+def single_flight(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Share one in-flight call between concurrent identical calls
+
+    Uses the instance's ``_inflight`` SingleFlight, keyed like ``cached``.
+    Calls with unhashable arguments, such as a list of tags, run on their own.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        key = _call_key(func, signature, (self, *args), kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            return await func(self, *args, **kwargs)
+        return await self._inflight.run(key, lambda: func(self, *args, **kwargs))
+
+    return wrapper
+
+
+def cached(
+    ttl: float,
+    stale_ttl: float = 0.0,
+    stale_if: Optional[Callable[[BaseException], bool]] = None,
+    max_ttl: Optional[float] = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache an async method's result in the instance's ``_cache`` for ttl seconds
+
+    Entries are keyed by method name and the bound arguments, so positional
+    and keyword calls share an entry. Concurrent misses for the same key share
+    one call through the instance's ``_inflight``. Pass ``cache=False`` to
+    skip the lookup and refresh the entry. Exceptions are never cached.
+
+    If a refresh raises an error accepted by ``stale_if``, the last good value
+    is returned instead, for up to stale_ttl seconds after it expired.
+
+    With ``max_ttl``, ttl becomes a floor and each entry lives for an
+    ``adaptive_ttl`` based on how long the call took, capped at max_ttl.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(
+            self: Any, *args: Any, cache: bool = True, **kwargs: Any
+        ) -> T:
+            key = _call_key(func, signature, (self, *args), kwargs)
+
+            if cache:
+                value = self._cache.get(key, _MISS)
+                if value is not _MISS:
+                    return value
+
+            async def load() -> T:
+                started = time.monotonic()
+                value = await func(self, *args, **kwargs)
+                entry_ttl = ttl
+                if max_ttl is not None:
+                    elapsed = time.monotonic() - started
+                    entry_ttl = adaptive_ttl(elapsed, ttl, max_ttl)
+                self._cache.set(key, value, entry_ttl, stale_ttl)
+                return value
+
+            try:
+                return await self._inflight.run(key, load)
+            except Exception as exc:
+                if stale_if is None or not stale_if(exc):
+                    raise
+                value = self._cache.get_stale(key, _MISS)
+                if value is _MISS:
+                    raise
+                return value
+
+        return wrapper
+
+    return decorator
@@ -1,17 +1,47 @@
 """Client helper functions for the MCP server"""
 
+import hashlib
+from collections import OrderedDict
 from typing import Optional
 
 from ..api.client import GoHighLevelClient
 from ..services.oauth import OAuthService
 
+# Token-override clients kept for reuse, least recently used evicted first
+OVERRIDE_CLIENT_CACHE_SIZE = 128
+
+# Keyed by a digest of the access token rather than the token itself
+_override_clients: "OrderedDict[str, GoHighLevelClient]" = OrderedDict()
+
+
+class _TokenOverrideOAuthService(OAuthService):
+    """OAuthService that answers agency token lookups with a fixed token
+
+    It borrows the HTTP client and standard-mode auth of the shared service,
+    so an override dropped from the cache has nothing of its own to close
+    and calls still running on it keep working.
+    """
+
+    def __init__(self, access_token: str, shared: OAuthService) -> None:
+        super().__init__()
+        self._access_token = access_token
+        self.client = shared.client
+        self._standard_auth = shared._standard_auth
+
+    async def get_valid_token(self) -> str:
+        return self._access_token
+
 
 async def get_client_with_token_override(
     oauth_service: Optional[OAuthService],
     ghl_client: Optional[GoHighLevelClient],
     access_token: Optional[str] = None,
 ) -> GoHighLevelClient:
-    """Get GHL client with optional token override"""
+    """Get GHL client with optional token override
+
+    Clients for an overriding token are reused across calls, so their
+    response caches and location tokens survive between tool invocations.
+    """
     # Ensure clients are initialized
     if oauth_service is None or ghl_client is None:
         raise RuntimeError(
@@ -19,13 +49,23 @@ async def get_client_with_token_override(
         )
 
     if access_token:
-        # Create a temporary client with the provided token
-        temp_oauth = OAuthService()
+        key = hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+        client = _override_clients.get(key)
+        # Only reuse clients built on the current global connection pool
+        if client is not None and client.client is ghl_client.client:
+            _override_clients.move_to_end(key)
+            return client
 
-        # Create an async function that returns the token
-        async def return_token() -> str:
-            return access_token
-
-        temp_oauth.get_valid_token = return_token  # type: ignore
-        return GoHighLevelClient(temp_oauth)
-    return ghl_client
\ No newline at end of file
+        # Create a client with the provided token, reusing the global
+        # connection pool instead of opening a new one per call
+        client = GoHighLevelClient(
+            _TokenOverrideOAuthService(access_token, oauth_service),
+            ghl_client.client,
+            ghl_client._semaphore,
+        )
+        _override_clients[key] = client
+        _override_clients.move_to_end(key)
+        while len(_override_clients) > OVERRIDE_CLIENT_CACHE_SIZE:
+            _override_clients.popitem(last=False)
+        return client
+    return ghl_client
@@ -79,4 +79,19 @@ def handle_api_error(response: httpx.Response) -> None:
             raise DuplicateResourceError(message, status_code, error_data)
         raise ValidationError(message, status_code, error_data)
     else:
-        raise GoHighLevelError(message, status_code, error_data)
\ No newline at end of file
+        raise GoHighLevelError(message, status_code, error_data)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Whether an error means the API was unavailable, not that we erred
+
+    True for 5xx responses and transport failures (timeouts, connection
+    errors), where retrying later or serving cached data makes sense.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    return (
+        isinstance(error, GoHighLevelError)
+        and error.status_code is not None
+        and error.status_code >= 500
+    )
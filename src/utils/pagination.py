@@ -0,0 +1,54 @@
+"""Offset pagination helpers for list endpoints"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Optional, Sequence, TypeVar
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[P]],
+    items: Callable[[P], Sequence[T]],
+    total: Callable[[P], Optional[int]],
+    page_size: int,
+    concurrency: int = 4,
+) -> AsyncIterator[T]:
+    """Yield every item of an offset-paginated list, in order
+
+    The first page is fetched alone. If it reports a total, the remaining
+    pages are fetched ``concurrency`` at a time; otherwise pages are
+    fetched one by one until a short page comes back.
+
+    Args:
+        fetch_page: Fetches the page starting at the given skip offset
+        items: Returns the items of a page
+        total: Returns the total item count a page reports, if any
+        page_size: Number of items requested per page
+        concurrency: Maximum number of pages fetched at once
+    """
+    page = await fetch_page(0)
+    page_items = items(page)
+    for item in page_items:
+        yield item
+    if len(page_items) < page_size:
+        return
+
+    expected = total(page)
+    if expected is None:
+        skip = page_size
+        while len(page_items) == page_size:
+            page_items = items(await fetch_page(skip))
+            for item in page_items:
+                yield item
+            skip += page_size
+        return
+
+    offsets = range(page_size, expected, page_size)
+    for start in range(0, len(offsets), concurrency):
+        pages = await asyncio.gather(
+            *(fetch_page(skip) for skip in offsets[start : start + concurrency])
+        )
+        for page in pages:
+            for item in items(page):
+                yield item
@@ -1,5 +1,9 @@
 """Unit tests for GoHighLevel API client with composition pattern"""
 
+import asyncio
+
+import httpx
+import orjson
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone
@@ -9,6 +13,7 @@ from src.models.contact import Contact, ContactCreate, ContactList
 from src.models.conversation import MessageCreate, MessageType, Message
 from src.utils.exceptions import (
     DuplicateResourceError,
+    GoHighLevelError,
 )
 
 
@@ -223,6 +228,23 @@ class TestGoHighLevelClient:
                         mock_cal_enter.assert_called_once()
                         mock_cal_exit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_many_returns_results_in_order(self, client, mock_contact):
+        """Test that run_many keeps call order and returns failures in place"""
+        error = DuplicateResourceError("Contact already exists", 400)
+
+        with patch.object(
+            client._contacts, "get_contact", side_effect=[mock_contact, error]
+        ):
+            results = await client.run_many(
+                [
+                    client.get_contact("test_contact_id", "test_location"),
+                    client.get_contact("other_contact_id", "test_location"),
+                ]
+            )
+
+        assert results == [mock_contact, error]
+
     @pytest.mark.asyncio
     async def test_all_contact_methods_exist(self, client):
         """Test that all expected contact methods exist and are callable"""
@@ -360,4 +382,226 @@ class TestSpecializedClientIntegration:
         client = GoHighLevelClient(mock_oauth_service)
 
         assert isinstance(client._calendars, CalendarsClient)
-        assert client._calendars.oauth_service == mock_oauth_service
\ No newline at end of file
+        assert client._calendars.oauth_service == mock_oauth_service
+
+    @pytest.mark.asyncio
+    async def test_specialized_clients_share_http_client(self, mock_oauth_service):
+        """Test that all specialized clients share a single HTTP connection pool"""
+        client = GoHighLevelClient(mock_oauth_service)
+
+        for sub_client in (
+            client._contacts,
+            client._conversations,
+            client._opportunities,
+            client._calendars,
+            client._forms,
+        ):
+            assert sub_client.client is client.client
+            assert sub_client._owns_client is False
+            assert sub_client._semaphore is client._semaphore
+
+        await client.__aexit__(None, None, None)
+        assert client.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_headers_cached_per_location(self, mock_oauth_service):
+        """Test that token lookups are cached per location"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+
+        first = await client._get_headers("test_location")
+        second = await client._get_headers("test_location")
+
+        assert first is second
+        assert first["Authorization"] == "Bearer location_token"
+        mock_oauth_service.get_location_token.assert_called_once_with("test_location")
+
+        await client._get_headers("other_location")
+        assert mock_oauth_service.get_location_token.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_get_revalidated_with_etag(self, mock_oauth_service):
+        """Test that a 304 reply is served from the body cached for its ETag"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+        ok = httpx.Response(
+            200, headers={"ETag": '"v1"'}, json={"contact": {"id": "c1"}}
+        )
+        not_modified = httpx.Response(304, request=httpx.Request("GET", "/"))
+        client.client.request = AsyncMock(side_effect=[ok, not_modified])
+
+        first = await client._request("GET", "/contacts/c1", location_id="loc_1")
+        second = await client._request("GET", "/contacts/c1", location_id="loc_1")
+
+        assert first is ok
+        assert second.status_code == 200
+        assert second.json() == {"contact": {"id": "c1"}}
+        sent = [c.kwargs["headers"] for c in client.client.request.call_args_list]
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_etag_key_ignores_param_order(self, mock_oauth_service):
+        """Test that list params are cached and param order shares an entry"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+        ok = httpx.Response(200, headers={"ETag": '"v1"'}, json={"contacts": []})
+        not_modified = httpx.Response(304, request=httpx.Request("GET", "/"))
+        client.client.request = AsyncMock(side_effect=[ok, not_modified])
+
+        await client._request(
+            "GET", "/contacts/", params={"ids": ["a", "b"], "limit": 10}
+        )
+        second = await client._request(
+            "GET", "/contacts/", params={"limit": 10, "ids": ["a", "b"]}
+        )
+
+        assert second.json() == {"contacts": []}
+        sent = client.client.request.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_not_modified_without_cached_body_raises(self, mock_oauth_service):
+        """Test that a 304 with nothing cached is not passed on as data"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+        client.client.request = AsyncMock(return_value=httpx.Response(304))
+
+        with pytest.raises(GoHighLevelError):
+            await client._request("GET", "/contacts/c1", location_id="loc_1")
+
+    @pytest.mark.asyncio
+    async def test_borrowed_http_client_left_open(self, mock_oauth_service):
+        """Test that a client built on another client's pool does not close it"""
+        owner = GoHighLevelClient(mock_oauth_service)
+        borrower = GoHighLevelClient(mock_oauth_service, owner.client, owner._semaphore)
+
+        assert borrower._contacts.client is owner.client
+        assert borrower._contacts._semaphore is owner._semaphore
+
+        await borrower.__aexit__(None, None, None)
+        assert not owner.client.is_closed
+
+        await owner.__aexit__(None, None, None)
+        assert owner.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_exit_closes_pool_when_sub_client_fails(self, mock_oauth_service):
+        """Test that one failing sub-client exit does not skip the others"""
+        client = GoHighLevelClient(mock_oauth_service)
+
+        with patch.object(
+            client._contacts, "__aexit__", side_effect=RuntimeError("boom")
+        ):
+            with patch.object(client._forms, "__aexit__") as mock_forms_exit:
+                with pytest.raises(RuntimeError, match="boom"):
+                    await client.__aexit__(None, None, None)
+
+        mock_forms_exit.assert_called_once_with(None, None, None)
+        assert client.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_sent_message_type_codes(self, mock_oauth_service):
+        """Test that sent messages report the numeric type for SMS and Email"""
+        from src.api.conversations import ConversationsClient
+
+        client = ConversationsClient(mock_oauth_service)
+        response = Mock()
+        response.content = b'{"conversationId": "conv123", "messageId": "msg123"}'
+
+        types = []
+        with patch.object(client, "_request", return_value=response):
+            for message_type in ("SMS", MessageType.EMAIL, "WhatsApp"):
+                message = MessageCreate(
+                    type=message_type, contactId="contact123", message="Hi"
+                )
+                sent = await client.send_message("conv123", message, "test_location")
+                types.append(sent.type)
+
+        assert types == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_send_message_payload(self, mock_oauth_service):
+        """Test that the SMS phone number is sent as phoneNumber"""
+        from src.api.conversations import ConversationsClient
+
+        client = ConversationsClient(mock_oauth_service)
+        response = Mock()
+        response.content = b'{"conversationId": "conv123", "messageId": "msg123"}'
+        message = MessageCreate(
+            type="SMS", contactId="contact123", message="Hi", phone="+15551234567"
+        )
+
+        with patch.object(client, "_request", return_value=response) as mock_request:
+            await client.send_message("conv123", message, "test_location")
+
+        assert mock_request.call_args.kwargs["json"] == {
+            "type": "SMS",
+            "contactId": "contact123",
+            "message": "Hi",
+            "phoneNumber": "+15551234567",
+            "conversationId": "conv123",
+        }
+
+    @pytest.mark.asyncio
+    async def test_send_message_omits_empty_phone(self, mock_oauth_service):
+        """Test that an empty phone number is left out of the payload"""
+        from src.api.conversations import ConversationsClient
+
+        client = ConversationsClient(mock_oauth_service)
+        response = Mock()
+        response.content = b'{"conversationId": "conv123", "messageId": "msg123"}'
+        message = MessageCreate(
+            type="Email", contactId="contact123", message="Hi", phone=""
+        )
+
+        with patch.object(client, "_request", return_value=response) as mock_request:
+            await client.send_message("conv123", message, "test_location")
+
+        assert "phoneNumber" not in mock_request.call_args.kwargs["json"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tag_changes_share_refetch(self, mock_oauth_service):
+        """Test that tag changes finishing together fetch the contact once"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+        contact = Mock()
+
+        with patch.object(client, "_request") as mock_request:
+            with patch.object(client, "get_contact", return_value=contact) as mock_get:
+                results = await asyncio.gather(
+                    client.add_contact_tags("contact123", ["vip"], "test_location"),
+                    client.remove_contact_tags("contact123", ["lead"], "test_location"),
+                )
+                # A later change gets a fresh fetch of its own
+                await client.add_contact_tags("contact123", ["new"], "test_location")
+
+        assert results == [contact, contact]
+        assert mock_request.call_count == 3
+        assert mock_get.call_count == 2
+        mock_get.assert_called_with("contact123", "test_location")
+
+    @pytest.mark.asyncio
+    async def test_create_contact_sends_model_json(self, mock_oauth_service):
+        """Test that write bodies are the model's JSON without unset fields"""
+        from src.api.contacts import ContactsClient
+
+        client = ContactsClient(mock_oauth_service)
+        response = Mock()
+        response.content = b'{"contact": {"id": "c1", "locationId": "test_location"}}'
+        contact = ContactCreate(locationId="test_location", firstName="John")
+
+        with patch.object(client, "_request", return_value=response) as mock_request:
+            await client.create_contact(contact)
+
+        body = mock_request.call_args.kwargs["content"]
+        assert orjson.loads(body) == {
+            "locationId": "test_location",
+            "firstName": "John",
+            "dnd": False,
+        }
@@ -4,6 +4,8 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
+
 from src.api.calendars import CalendarsClient
 from src.models.calendar import AppointmentCreate, Appointment
 
@@ -47,18 +49,20 @@ class TestAppointmentCreationFix:
         # Mock the minimal response from GoHighLevel API
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": "new_appointment_id",
-            "calendarId": calendar_id,
-            "contactId": contact_id,
-            "title": "Test Appointment",
-            "status": "booked",
-            "appoinmentStatus": "confirmed",  # Note the typo in API
-            "assignedUserId": "test_user_id",
-            "address": "https://zoom.us/j/123456",
-            "isRecurring": False,
-            "traceId": "test-trace-id",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "id": "new_appointment_id",
+                "calendarId": calendar_id,
+                "contactId": contact_id,
+                "title": "Test Appointment",
+                "status": "booked",
+                "appoinmentStatus": "confirmed",  # Note the typo in API
+                "assignedUserId": "test_user_id",
+                "address": "https://zoom.us/j/123456",
+                "isRecurring": False,
+                "traceId": "test-trace-id",
+            }
+        )
 
         # Patch the _request method
         with patch.object(
@@ -143,13 +147,15 @@ class TestAppointmentCreationFix:
         # Mock successful response
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": "new_id",
-            "calendarId": "test_calendar_id",
-            "contactId": "test_contact_id",
-            "title": "Test Appointment",
-            "status": "booked",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "id": "new_id",
+                "calendarId": "test_calendar_id",
+                "contactId": "test_contact_id",
+                "title": "Test Appointment",
+                "status": "booked",
+            }
+        )
 
         with patch.object(
             calendars_client, "_request", new_callable=AsyncMock
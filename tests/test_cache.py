@@ -0,0 +1,271 @@
+"""Unit tests for the in-process TTL cache"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.api.client import GoHighLevelClient
+from src.utils.cache import TTLCache, adaptive_ttl
+from src.utils.exceptions import GoHighLevelError, ResourceNotFoundError
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction"""
+
+    def test_entry_expires_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed"""
+        cache = TTLCache()
+
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value", 10.0)
+            assert cache.get("key") == "value"
+
+        with patch("src.utils.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+            assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test that the least recently used entry is evicted at maxsize"""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, 60.0)
+        cache.set("b", 2, 60.0)
+        cache.get("a")
+        cache.set("c", 3, 60.0)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_adaptive_ttl_grows_with_latency(self):
+        """Test that slower fetches are cached longer, within bounds"""
+        assert adaptive_ttl(0.1, 30.0, 300.0) == 30.0
+        assert adaptive_ttl(5.0, 30.0, 300.0) == 52.0
+        assert adaptive_ttl(60.0, 30.0, 300.0) == 300.0
+
+
+class TestCachedClientReads:
+    """Test caching of rarely-changing reads on GoHighLevelClient"""
+
+    @pytest.fixture
+    def client(self):
+        """Create API client instance"""
+        service = Mock()
+        service.get_valid_token = AsyncMock(return_value="agency_token")
+        service.get_location_token = AsyncMock(return_value="location_token")
+        return GoHighLevelClient(service)
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self, client):
+        """Test that identical reads only reach the API once"""
+        with patch.object(
+            client._opportunities, "get_pipelines", return_value=["pipeline"]
+        ) as mock_get:
+            first = await client.get_pipelines("loc_1")
+            second = await client.get_pipelines(location_id="loc_1")
+            await client.get_pipelines("loc_2")
+
+        assert first is second
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_bypass(self, client):
+        """Test that cache=False always reaches the API"""
+        with patch.object(
+            client._calendars, "get_calendars", return_value="calendars"
+        ) as mock_get:
+            await client.get_calendars("loc_1")
+            await client.get_calendars("loc_1", cache=False)
+
+        assert mock_get.call_count == 2
+        mock_get.assert_called_with("loc_1")
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, client):
+        """Test that a failed read is retried on the next call"""
+        with patch.object(
+            client._forms,
+            "get_forms",
+            side_effect=[RuntimeError("boom"), "forms"],
+        ) as mock_get:
+            with pytest.raises(RuntimeError):
+                await client.get_forms("loc_1")
+            assert await client.get_forms("loc_1") == "forms"
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_coalesced(self, client):
+        """Test that concurrent identical reads share one in-flight request"""
+
+        async def slow_get_contact(contact_id, location_id):
+            await asyncio.sleep(0.01)
+            return contact_id
+
+        with patch.object(
+            client._contacts, "get_contact", side_effect=slow_get_contact
+        ) as mock_get:
+            results = await asyncio.gather(
+                client.get_contact("contact_1", "loc_1"),
+                client.get_contact("contact_1", location_id="loc_1"),
+                client.get_contact("contact_2", "loc_1"),
+            )
+
+        assert results == ["contact_1", "contact_1", "contact_2"]
+        assert mock_get.call_count == 2
+        assert len(client._inflight) == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_list_reads_coalesced(self, client):
+        """Test that concurrent identical list reads share one request"""
+
+        async def slow_get_contacts(**kwargs):
+            await asyncio.sleep(0.01)
+            return kwargs["location_id"]
+
+        with patch.object(
+            client._contacts, "get_contacts", side_effect=slow_get_contacts
+        ) as mock_get:
+            await asyncio.gather(
+                client.get_contacts("loc_1", limit=100),
+                client.get_contacts(location_id="loc_1"),
+                client.get_contacts("loc_1", tags=["vip"]),
+                client.get_contacts("loc_1", tags=["vip"]),
+            )
+
+        # Calls with a list argument cannot be keyed, so each runs on its own
+        assert mock_get.call_count == 3
+        assert len(client._inflight) == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_on_upstream_failure(self, client):
+        """Test that an expired entry is served when the refresh hits a 5xx"""
+        with patch.object(
+            client._opportunities,
+            "get_pipelines",
+            side_effect=[
+                ["pipeline"],
+                GoHighLevelError("Service unavailable", 503),
+                ResourceNotFoundError("Not found", 404),
+            ],
+        ):
+            with patch("src.utils.cache.time.monotonic", return_value=0.0):
+                await client.get_pipelines("loc_1")
+
+            with patch("src.utils.cache.time.monotonic", return_value=600.0):
+                assert await client.get_pipelines("loc_1") == ["pipeline"]
+                with pytest.raises(ResourceNotFoundError):
+                    await client.get_pipelines("loc_1")
+
+
+class TestCachedResources:
+    """Test short-lived caching of rendered MCP resources"""
+
+    @pytest.fixture(autouse=True)
+    def clear_resource_cache(self):
+        """Start each test with an empty resource cache"""
+        from src import main
+
+        main._resource_cache.clear()
+        yield
+        main._resource_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_render_once(self):
+        """Test that repeated and concurrent reads of one URI share a render"""
+        from src import main
+
+        client = Mock()
+        client.get_calendars = AsyncMock(return_value=Mock(calendars=[], count=0))
+        read = main.list_calendars_resource.fn
+
+        with patch.object(main, "ghl_client", client):
+            first, second = await asyncio.gather(read("loc_1"), read("loc_1"))
+            third = await read(location_id="loc_1")
+            await read("loc_2")
+
+        assert first == second == third
+        assert "# Calendars for Location loc_1" in first
+        assert client.get_calendars.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resource_expires_after_ttl(self):
+        """Test that a resource is rendered again once its entry expires"""
+        from src import main
+
+        client = Mock()
+        client.get_calendars = AsyncMock(return_value=Mock(calendars=[], count=0))
+        read = main.list_calendars_resource.fn
+
+        with patch.object(main, "ghl_client", client):
+            with patch("src.utils.cache.time.monotonic", return_value=0.0):
+                await read("loc_1")
+            with patch("src.utils.cache.time.monotonic", return_value=60.0):
+                await read("loc_1")
+
+        assert client.get_calendars.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_render_ttl_capped(self):
+        """Test that a slow render is not kept past RESOURCE_MAX_TTL"""
+        from src import main
+
+        now = [0.0]
+
+        async def slow_get_calendars(location_id):
+            now[0] += 100.0
+            return Mock(calendars=[], count=0)
+
+        client = Mock()
+        client.get_calendars = AsyncMock(side_effect=slow_get_calendars)
+        read = main.list_calendars_resource.fn
+
+        with patch.object(main, "ghl_client", client):
+            with patch.object(main, "RESOURCE_RENDER_TIMEOUT", 1e9):
+                with patch("src.utils.cache.time.monotonic", lambda: now[0]):
+                    await read("loc_1")
+                    now[0] = 100.0 + main.RESOURCE_MAX_TTL - 1
+                    await read("loc_1")
+                    assert client.get_calendars.await_count == 1
+                    now[0] = 100.0 + main.RESOURCE_MAX_TTL + 1
+                    await read("loc_1")
+
+        assert client.get_calendars.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_render_returns_job_then_result(self):
+        """Test that a slow read gets a job ID to poll while the render finishes"""
+        from fastmcp import FastMCP
+
+        from src import main
+        from src.mcp.params.resources import PollResourceJobParams
+        from src.mcp.tools.resources import _register_resource_tools
+
+        async def slow_get_calendars(location_id):
+            await asyncio.sleep(0.05)
+            return Mock(calendars=[], count=0)
+
+        client = Mock()
+        client.get_calendars = AsyncMock(side_effect=slow_get_calendars)
+        read = main.list_calendars_resource.fn
+        server = FastMCP("test-server")
+        _register_resource_tools(server)
+        poll = (await server.get_tools())["poll_resource_job"].fn
+
+        with patch.object(main, "ghl_client", client):
+            with patch.object(main, "RESOURCE_RENDER_TIMEOUT", 0.01):
+                pending = await read("loc_1")
+                assert pending.startswith("PENDING job_id=")
+                job_id = pending.split("=", 1)[1].split()[0]
+                params = PollResourceJobParams(job_id=job_id)
+
+                assert (await poll(params))["status"] == "pending"
+                await asyncio.sleep(0.1)
+                done = await poll(params)
+                text = await read("loc_1")
+
+        assert done["status"] == "done"
+        assert "# Calendars for Location loc_1" in done["content"]
+        assert text == done["content"]
+        assert client.get_calendars.await_count == 1
+        assert (await poll(params))["success"] is False
@@ -1,9 +1,12 @@
 """Test calendar endpoint fixes"""
 
 import pytest
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
+
 from src.api.calendars import CalendarsClient
 from src.models.calendar import FreeSlotsResult, FreeSlot
 
@@ -35,16 +38,18 @@ class TestCalendarsFix:
         # Mock the response from the API
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "2025-06-10": {
-                "slots": [
-                    "2025-06-10T11:00:00-05:00",
-                    "2025-06-10T11:30:00-05:00",
-                    "2025-06-10T13:00:00-05:00",
-                ]
-            },
-            "traceId": "test-trace-id",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "2025-06-10": {
+                    "slots": [
+                        "2025-06-10T11:00:00-05:00",
+                        "2025-06-10T11:30:00-05:00",
+                        "2025-06-10T13:00:00-05:00",
+                    ]
+                },
+                "traceId": "test-trace-id",
+            }
+        )
 
         # Patch the _request method to capture the request params
         with patch.object(
@@ -72,12 +77,14 @@ class TestCalendarsFix:
             assert isinstance(call_args[1]["params"]["startDate"], int)
             assert isinstance(call_args[1]["params"]["endDate"], int)
 
-            # Verify the timestamps are correct
+            # Verify the timestamps are midnight in the requested timezone
+            tz = ZoneInfo(timezone)
+            midnight = datetime.min.time()
             start_timestamp = int(
-                datetime.combine(start_date, datetime.min.time()).timestamp() * 1000
+                datetime.combine(start_date, midnight, tzinfo=tz).timestamp() * 1000
             )
             end_timestamp = int(
-                datetime.combine(end_date, datetime.min.time()).timestamp() * 1000
+                datetime.combine(end_date, midnight, tzinfo=tz).timestamp() * 1000
             )
             assert call_args[1]["params"]["startDate"] == start_timestamp
             assert call_args[1]["params"]["endDate"] == end_timestamp
@@ -96,6 +103,39 @@ class TestCalendarsFix:
             assert isinstance(first_slot.startTime, datetime)
             assert first_slot.available is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timezone", ["Not/AZone", "../etc/passwd"])
+    async def test_get_free_slots_unknown_timezone_uses_utc(
+        self, calendars_client, timezone
+    ):
+        """Test that an unknown timezone name falls back to UTC midnight"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"traceId": "test-trace-id"})
+
+        with patch.object(
+            calendars_client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = mock_response
+
+            await calendars_client.get_free_slots(
+                calendar_id="test_calendar_id",
+                location_id="test_location_id",
+                start_date=date(2025, 6, 10),
+                timezone=timezone,
+            )
+
+        midnight = datetime(2025, 6, 10, tzinfo=dt_timezone.utc)
+        params = mock_request.call_args[1]["params"]
+        assert params["startDate"] == int(midnight.timestamp() * 1000)
+
+    def test_format_datetime_unknown_timezone_raises(self):
+        """Test that formatting with an unknown timezone name is a clear error"""
+        with pytest.raises(ValueError, match="Unknown timezone: 'Not/AZone'"):
+            CalendarsClient.format_datetime_with_timezone(
+                datetime(2025, 6, 10, 11, 0), "Not/AZone"
+            )
+
     @pytest.mark.asyncio
     async def test_create_appointment_endpoint_path(self, calendars_client):
         """Test that create_appointment uses the correct endpoint path"""
@@ -115,17 +155,19 @@ class TestCalendarsFix:
         # Mock the response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "new_appointment_id",
-            "calendarId": "test_calendar_id",
-            "contactId": "test_contact_id",
-            "title": "Test Appointment",
-            "status": "booked",
-            "appoinmentStatus": "confirmed",
-            "assignedUserId": "test_user_id",
-            "address": "https://zoom.us/j/123456",
-            "isRecurring": False,
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "id": "new_appointment_id",
+                "calendarId": "test_calendar_id",
+                "contactId": "test_contact_id",
+                "title": "Test Appointment",
+                "status": "booked",
+                "appoinmentStatus": "confirmed",
+                "assignedUserId": "test_user_id",
+                "address": "https://zoom.us/j/123456",
+                "isRecurring": False,
+            }
+        )
 
         # Mock a complete appointment response
         complete_response = {
@@ -142,7 +184,7 @@ class TestCalendarsFix:
             "isRecurring": False,
         }
 
-        mock_response.json.return_value = complete_response
+        mock_response.content = orjson.dumps(complete_response)
 
         # Patch the _request method
         with patch.object(
@@ -179,22 +221,24 @@ class TestCalendarsFix:
         # Mock the actual response format from GoHighLevel
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "2025-06-10": {
-                "slots": [
-                    "2025-06-10T09:00:00-05:00",
-                    "2025-06-10T09:30:00-05:00",
-                    "2025-06-10T10:00:00-05:00",
-                ]
-            },
-            "2025-06-11": {
-                "slots": [
-                    "2025-06-11T14:00:00-05:00",
-                    "2025-06-11T14:30:00-05:00",
-                ]
-            },
-            "traceId": "test-trace-id",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "2025-06-10": {
+                    "slots": [
+                        "2025-06-10T09:00:00-05:00",
+                        "2025-06-10T09:30:00-05:00",
+                        "2025-06-10T10:00:00-05:00",
+                    ]
+                },
+                "2025-06-11": {
+                    "slots": [
+                        "2025-06-11T14:00:00-05:00",
+                        "2025-06-11T14:30:00-05:00",
+                    ]
+                },
+                "traceId": "test-trace-id",
+            }
+        )
 
         with patch.object(
             calendars_client, "_request", new_callable=AsyncMock
@@ -237,4 +281,39 @@ class TestCalendarsFix:
                     end_dt = slot.endTime
 
                 # Check that end time is 30 minutes after start time
-                assert end_dt == start_dt + timedelta(minutes=30)
\ No newline at end of file
+                assert end_dt == start_dt + timedelta(minutes=30)
+
+    @pytest.mark.asyncio
+    async def test_get_appointments_many_preserves_order(self, calendars_client):
+        """Test that appointments fetched concurrently come back in request order"""
+
+        async def fake_get_appointment(appointment_id, location_id):
+            return appointment_id
+
+        with patch.object(
+            calendars_client, "get_appointment", side_effect=fake_get_appointment
+        ) as mock_get:
+            result = await calendars_client.get_appointments_many(
+                ["appt_1", "appt_2", "appt_3"], "test_location_id"
+            )
+
+        assert result == ["appt_1", "appt_2", "appt_3"]
+        assert mock_get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_appointment_accepts_no_content(self, calendars_client):
+        """Test that a 204 No Content delete is reported as success"""
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+
+        with patch.object(
+            calendars_client, "_request", return_value=mock_response
+        ) as mock_request:
+            result = await calendars_client.delete_appointment(
+                "appt_1", "test_location_id"
+            )
+
+        assert result is True
+        mock_request.assert_called_once_with(
+            "DELETE", "/calendars/events/appt_1", location_id="test_location_id"
+        )
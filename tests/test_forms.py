@@ -1,9 +1,14 @@
 """Tests for forms functionality"""
 
+import base64
+import io
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
+import orjson
+
 from src.models.form import (
     Form,
     FormField,
@@ -80,11 +85,13 @@ async def test_get_forms(forms_client, sample_form):
     # Mock the response
     with patch.object(forms_client, "_request") as mock_request:
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "forms": [sample_form.model_dump()],
-            "total": 1,
-            "count": 1,
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "forms": [sample_form.model_dump()],
+                "total": 1,
+                "count": 1,
+            }
+        )
         mock_request.return_value = mock_response
 
         # Call the method
@@ -122,7 +129,9 @@ async def test_upload_form_file(forms_client):
         with patch.object(forms_client.client, "post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"success": True, "fileId": "file_123"}
+            mock_response.content = orjson.dumps(
+                {"success": True, "fileId": "file_123"}
+            )
             mock_post.return_value = mock_response
 
             # Call the method
@@ -139,16 +148,51 @@ async def test_upload_form_file(forms_client):
             assert "data" in call_kwargs
 
 
+@pytest.mark.asyncio
+async def test_upload_form_file_decodes_wrapped_base64(forms_client):
+    """Test that line-wrapped base64 uploads are decoded in full"""
+    content = b"Test file content" * 10000
+    file_upload = FormFileUploadRequest(
+        contactId="contact_123",
+        locationId="loc_123",
+        fieldId="file_field_123",
+        fileName="test.pdf",
+        fileContent=base64.encodebytes(content).decode(),
+    )
+    sent = []
+
+    async def fake_post(url, files, **kwargs):
+        assert isinstance(files["file"][1], io.BytesIO)
+        sent.append(files["file"][1].read())
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b"{}"
+        return response
+
+    with patch.object(forms_client, "_get_headers", return_value={}):
+        with patch.object(forms_client.client, "post", side_effect=fake_post):
+            await forms_client.upload_form_file(file_upload)
+
+    assert sent == [content]
+
+
 @pytest.mark.asyncio
 async def test_get_all_submissions(forms_client, sample_submission):
     """Test getting all form submissions"""
     # Mock the response
     with patch.object(forms_client, "_request") as mock_request:
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "submissions": [sample_submission.model_dump()],
-            "meta": {"total": 1, "currentPage": 1, "nextPage": None, "prevPage": None},
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "submissions": [sample_submission.model_dump()],
+                "meta": {
+                    "total": 1,
+                    "currentPage": 1,
+                    "nextPage": None,
+                    "prevPage": None,
+                },
+            }
+        )
         mock_request.return_value = mock_response
 
         # Call the method
@@ -1,5 +1,9 @@
 """Updated unit tests for MCP endpoints with FastMCP decorator support"""
 
+import asyncio
+
+import httpx
+import orjson
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime, timezone
@@ -292,6 +296,67 @@ class TestMCPClientHelpers:
                     mock_client_class.assert_called_once()
                     assert client == mock_client_instance
 
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_token_client(self):
+        """Test that clients for the same access token are reused"""
+        from src.main import get_client
+
+        global_client = AsyncMock()
+        with patch("src.main.oauth_service", AsyncMock()):
+            with patch("src.main.ghl_client", global_client):
+                first = await get_client("reused_token")
+                second = await get_client("reused_token")
+                other = await get_client("other_token")
+
+        assert first is second
+        assert other is not first
+        # Token clients still share the global connection pool
+        assert first.client is global_client.client
+
+    @pytest.mark.asyncio
+    async def test_token_client_evicted_mid_call_keeps_working(self):
+        """Test that a call still running on an evicted token client finishes"""
+        from collections import OrderedDict
+
+        from src.main import get_client
+        from src.utils import client_helpers
+
+        release = asyncio.Event()
+
+        async def slow_token_endpoint(request):
+            await release.wait()
+            return httpx.Response(200, json={"access_token": "location_token"})
+
+        shared = AsyncMock()
+        shared.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(slow_token_endpoint)
+        )
+        shared._standard_auth = None
+        with patch("src.main.oauth_service", shared):
+            with patch("src.main.ghl_client", AsyncMock()):
+                with patch.object(client_helpers, "OVERRIDE_CLIENT_CACHE_SIZE", 1):
+                    with patch.object(
+                        client_helpers, "_override_clients", OrderedDict()
+                    ) as cached:
+                        first = await get_client("token_1")
+                        in_flight = asyncio.create_task(
+                            first.oauth_service.client.post(
+                                "https://services.leadconnectorhq.com/oauth/locationToken"
+                            )
+                        )
+                        await asyncio.sleep(0)
+                        second = await get_client("token_2")
+                        assert list(cached.values()) == [second]
+
+                        release.set()
+                        response = await in_flight
+
+        assert response.json() == {"access_token": "location_token"}
+        # Token clients borrow the shared service's HTTP client
+        assert first.oauth_service.client is shared.client
+        assert not shared.client.is_closed
+        await shared.client.aclose()
+
     @pytest.mark.asyncio
     async def test_get_client_without_token(self):
         """Test get_client without access token (uses global client)"""
@@ -315,4 +380,104 @@ class TestMCPClientHelpers:
                 with pytest.raises(
                     RuntimeError, match="MCP server not properly initialized"
                 ):
-                    await get_client(None)
\ No newline at end of file
+                    await get_client(None)
+
+
+async def _batch_execute_tool():
+    """Register batch_execute next to a simple tool on a fresh server"""
+    from fastmcp import FastMCP
+    from src.mcp.tools.batch import _register_batch_tools
+
+    server = FastMCP("test-server")
+
+    @server.tool()
+    async def double(value: int) -> int:
+        if value < 0:
+            raise ValueError("negative value")
+        return value * 2
+
+    _register_batch_tools(server)
+    return (await server.get_tools())["batch_execute"].fn
+
+
+class TestBatchExecute:
+    """Test the batch_execute tool"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_call_order(self):
+        """Test that each call reports its own result or error, in order"""
+        from src.mcp.params.batch import BatchExecuteParams
+
+        batch_execute = await _batch_execute_tool()
+        result = await batch_execute(
+            BatchExecuteParams(
+                calls=[
+                    {"tool": "double", "arguments": {"value": 2}},
+                    {"tool": "double", "arguments": {"value": -1}},
+                    {"tool": "missing", "arguments": {}},
+                    {"tool": "double", "arguments": {"value": "3"}},
+                ]
+            )
+        )
+
+        assert result["success"] is False
+        assert [r["success"] for r in result["results"]] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert result["results"][0]["result"] == 4
+        assert "negative value" in result["results"][1]["error"]
+        assert result["results"][2]["error"] == "Unknown tool: missing"
+        assert result["results"][3]["result"] == 6
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_skips_remaining_calls(self):
+        """Test that calls not yet started are skipped after a failure"""
+        from src.mcp.params.batch import BatchExecuteParams
+
+        batch_execute = await _batch_execute_tool()
+        result = await batch_execute(
+            BatchExecuteParams(
+                calls=[
+                    {"tool": "double", "arguments": {"value": -1}},
+                    {"tool": "double", "arguments": {"value": 1}},
+                ],
+                max_concurrent=1,
+                stop_on_error=True,
+            )
+        )
+
+        assert result["results"][1] == {
+            "tool": "double",
+            "success": False,
+            "error": "Skipped after an earlier call failed",
+        }
+
+
+class TestToolSerializer:
+    """Test the tool result serializer"""
+
+    def test_compact_json_with_models_and_datetimes(self):
+        """Test that results are compact JSON, including non-native values"""
+        from src.main import _serialize_tool_result
+
+        contact = Contact(id="contact_1", locationId="loc_1")
+        result = _serialize_tool_result(
+            {
+                "success": True,
+                "date": datetime(2025, 6, 1, tzinfo=timezone.utc),
+                "contact": contact,
+            }
+        )
+
+        assert result.startswith('{"success":true,"date":"2025-06-01T00:00:00Z"')
+        assert orjson.loads(result)["contact"]["id"] == "contact_1"
+
+    def test_values_orjson_rejects_fall_back_to_pydantic(self):
+        """Test that wide ints and non-str keys serialize as they did before"""
+        from src.main import _serialize_tool_result
+
+        assert _serialize_tool_result({"big": 2**70}) == f'{{"big":{2**70}}}'
+        assert _serialize_tool_result({1: "one"}) == '{"1":"one"}'
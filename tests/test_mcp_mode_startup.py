@@ -3,6 +3,9 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from src.services.setup import StandardModeSetup
 
@@ -98,4 +101,58 @@ OAUTH_SERVER_PORT=8080
 
         # Should be in the same directory as the module parent
         expected_root = Path(__file__).parent.parent  # tests/ -> project root
-        assert setup.env_file.parent == expected_root
\ No newline at end of file
+        assert setup.env_file.parent == expected_root
+
+
+class TestStartupCheckAndSetup:
+    """Test the interactive startup check's choice of setup step"""
+
+    @pytest.fixture
+    def setup(self):
+        """Mock setup helper, returned by StandardModeSetup() in main"""
+        setup = MagicMock()
+        setup.__aenter__.return_value = setup
+        setup.interactive_setup = AsyncMock(return_value=True)
+        setup.interactive_custom_setup = AsyncMock(return_value=True)
+        setup.validate_existing_config = AsyncMock(return_value=True)
+        with patch("src.main.StandardModeSetup", return_value=setup):
+            yield setup
+
+    @pytest.mark.asyncio
+    async def test_valid_existing_config_starts_server(self, setup):
+        """Test that a validated config skips setup, checking auth once"""
+        from src.main import startup_check_and_setup
+
+        setup.is_first_run.return_value = False
+        setup.check_auth_status.return_value = (True, "Standard mode configured")
+
+        assert await startup_check_and_setup() is True
+        setup.check_auth_status.assert_called_once()
+        setup.interactive_setup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_custom_config_reruns_custom_setup(self, setup):
+        """Test that a rejected custom config re-runs custom setup"""
+        from src.main import startup_check_and_setup
+
+        setup.is_first_run.return_value = False
+        setup.check_auth_status.return_value = (True, "Custom mode configured")
+        setup.validate_existing_config.return_value = False
+        setup.env_file.exists.return_value = True
+
+        assert await startup_check_and_setup() == "exit_after_setup"
+        setup.interactive_custom_setup.assert_awaited_once()
+        setup.check_auth_status.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_first_run_custom_without_app_exits(self, setup):
+        """Test that first-run custom setup exits until the app is created"""
+        from src.main import startup_check_and_setup
+
+        setup.is_first_run.return_value = True
+        setup.choose_auth_mode.return_value = "custom"
+        setup.interactive_custom_setup.return_value = False
+
+        assert await startup_check_and_setup() == "exit_after_custom_instructions"
+        setup.save_custom_mode_choice.assert_called_once()
+        setup.clear_custom_mode_choice.assert_not_called()
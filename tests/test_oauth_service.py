@@ -1,5 +1,7 @@
 """Updated unit tests for OAuth service with Standard/Custom mode support"""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, mock_open
 import json
@@ -199,6 +201,32 @@ class TestOAuthServiceCustomMode:
         assert new_token.access_token == "refreshed_access_token"
         mock_save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(
+        self, oauth_service_custom, valid_stored_token
+    ):
+        """Test that an expiring token is refreshed once for concurrent callers"""
+        expiring_token = valid_stored_token.model_copy(
+            update={"expires_at": datetime.now(timezone.utc)}
+        )
+
+        async def slow_refresh(refresh_token):
+            await asyncio.sleep(0.01)
+            return valid_stored_token
+
+        with patch.object(
+            oauth_service_custom, "load_token", return_value=expiring_token
+        ):
+            with patch.object(
+                oauth_service_custom, "refresh_token", side_effect=slow_refresh
+            ) as mock_refresh:
+                tokens = await asyncio.gather(
+                    *(oauth_service_custom.get_valid_token() for _ in range(3))
+                )
+
+        assert tokens == ["valid_token"] * 3
+        mock_refresh.assert_called_once_with("refresh_token")
+
 
 class TestStandardAuthService:
     """Test StandardAuthService directly"""
@@ -286,6 +314,32 @@ class TestStandardAuthService:
             == f"Bearer {mock_config_data['setup_token']}"
         )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_company_token_fetches_coalesced(self, auth_service):
+        """Test that concurrent cache misses share one Supabase request"""
+        auth_service._company_token_cache = None
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": "new_company_token",
+            "expires_at": (
+                datetime.now(timezone.utc) + timedelta(hours=24)
+            ).isoformat(),
+        }
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        auth_service.client.post.side_effect = slow_post
+
+        tokens = await asyncio.gather(
+            auth_service.get_company_token(), auth_service.get_company_token()
+        )
+
+        assert tokens == ["new_company_token", "new_company_token"]
+        auth_service.client.post.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_exchange_company_for_location_token(self, auth_service):
         """Test exchanging company token for location token"""
@@ -0,0 +1,59 @@
+"""Unit tests for offset pagination helpers"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.utils.pagination import paginate
+
+
+def _fake_pages(total_items, page_size, report_total=True):
+    """Build a fetch_page mock serving integers 0..total_items-1"""
+
+    async def fetch_page(skip):
+        items = list(range(skip, min(skip + page_size, total_items)))
+        return {"items": items, "total": total_items if report_total else None}
+
+    return AsyncMock(side_effect=fetch_page)
+
+
+async def _collect(fetch_page, page_size, concurrency=4):
+    return [
+        item
+        async for item in paginate(
+            fetch_page,
+            lambda page: page["items"],
+            lambda page: page["total"],
+            page_size,
+            concurrency,
+        )
+    ]
+
+
+class TestPaginate:
+    """Test paginate"""
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_in_order(self):
+        """Test that all pages are fetched once and yielded in order"""
+        fetch_page = _fake_pages(250, 100)
+
+        result = await _collect(fetch_page, 100, concurrency=2)
+
+        assert result == list(range(250))
+        assert [c.args[0] for c in fetch_page.call_args_list] == [0, 100, 200]
+
+    @pytest.mark.asyncio
+    async def test_short_first_page_stops(self):
+        """Test that a short first page needs no further requests"""
+        fetch_page = _fake_pages(30, 100)
+
+        assert await _collect(fetch_page, 100) == list(range(30))
+        fetch_page.assert_called_once_with(0)
+
+    @pytest.mark.asyncio
+    async def test_without_total_fetches_until_short_page(self):
+        """Test sequential paging when the API reports no total"""
+        fetch_page = _fake_pages(200, 100, report_total=False)
+
+        assert await _collect(fetch_page, 100) == list(range(200))
+        assert [c.args[0] for c in fetch_page.call_args_list] == [0, 100, 200]